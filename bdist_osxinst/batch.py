@@ -0,0 +1,245 @@
+# Building the installer packages of many distributions in one process
+#
+# Usage: python -m bdist_osxinst.batch [-j N] projects.toml
+#
+# The project file lists the source trees (the directories containing the
+# setup.py files) and the bdist_osxinst options. In TOML format:
+#
+#   jobs = 8                    # size of the shared build pool (default: number of CPUs)
+#
+#   [defaults]                  # bdist_osxinst options for all projects
+#   backend = "native"
+#   cache-dir = "/var/cache/osxinst"
+#
+#   [[project]]
+#   path = "src/foo"            # relative to the project file
+#   title = "Foo"               # options for this project only
+#
+#   [[project]]
+#   path = "src/bar"
+#   setup = "setup_osx.py"      # default: setup.py
+#
+# Files with another extension are read as ini files with a [batch] section
+# (jobs), an optional [defaults] section and one "[project <name>]" section
+# per project (in the order they should be built).
+#
+# The setup scripts are run one after another in the main thread (distutils
+# needs the current directory to be the source tree while the distribution is
+# built and installed into the stage area). Everything after that uses
+# absolute paths only and runs in the background: the component packages of
+# all projects are built by one shared pool of workers while the next project
+# is being staged, and the product packages are created as soon as all their
+# component packages are done. Tool lookups are cached for the whole process
+# and a shared package cache (cache-dir) can be set for all projects in the
+# [defaults] section. The pythons and single-product options can't be used
+# in batch builds.
+
+import sys, os, os.path, argparse, time, traceback
+import concurrent.futures
+from distutils.core import run_setup
+from distutils.errors import DistutilsError
+from distutils import log
+from .bdist_osxinst import bdist_osxinst
+if sys.version_info[0]>=3:
+    from configparser import ConfigParser
+else:
+    from ConfigParser import ConfigParser
+
+
+class Project:
+    """A source tree whose installer package should be built.
+    """
+    def __init__(self, name, path, setup_script="setup.py", options=None):
+        # A name for the log output (the base name of path by default)
+        self.name = name
+        # The absolute path of the source tree
+        self.path = path
+        # The setup script (relative to path)
+        self.setup_script = setup_script
+        # bdist_osxinst options (key: option name, value: option value)
+        self.options = options or {}
+        # The Distribution object returned by the setup script
+        self.distribution = None
+        # The finished product package, the error message (if the build failed)
+        # and the total build time
+        self.product = None
+        self.error = None
+        self.seconds = None
+
+
+def read_project_file(filename):
+    """Read a project file and return a tuple (jobs, projects).
+
+    jobs is the size of the build pool (None if not specified) and projects
+    a list of Project objects.
+    """
+    base_dir = os.path.dirname(os.path.abspath(filename))
+    if filename.endswith(".toml"):
+        data = _read_toml(filename)
+        jobs = data.get("jobs")
+        defaults = data.get("defaults", {})
+        entries = []
+        for entry in data.get("project", []):
+            entry = dict(entry)
+            if "path" not in entry:
+                raise DistutilsError("%s: project without path"%filename)
+            entries.append((entry.pop("name", None), entry))
+    else:
+        config = ConfigParser()
+        config.read(filename)
+        jobs = config.get("batch", "jobs") if config.has_option("batch", "jobs") else None
+        defaults = dict(config.items("defaults")) if config.has_section("defaults") else {}
+        entries = []
+        for section in config.sections():
+            if not section.startswith("project"):
+                continue
+            entry = dict(config.items(section))
+            if "path" not in entry:
+                raise DistutilsError("%s: section [%s] has no path"%(filename, section))
+            entries.append((section[len("project"):].strip() or None, entry))
+
+    projects = []
+    for name,entry in entries:
+        path = os.path.normpath(os.path.join(base_dir, entry.pop("path")))
+        setup_script = entry.pop("setup", "setup.py")
+        options = dict(defaults)
+        options.update(entry)
+        for key in options:
+            if key.replace("-", "_") in ["pythons", "single_product"]:
+                raise DistutilsError("%s: the %s option is not supported in batch builds"%(filename, key))
+        projects.append(Project(name or os.path.basename(path), path, setup_script, options))
+    if jobs is not None:
+        jobs = int(jobs)
+    return jobs, projects
+
+
+def _read_toml(filename):
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise DistutilsError("reading %s requires Python 3.11 or the tomli package "
+                                 "(or use an ini file instead)"%filename)
+    f = open(filename, "rb")
+    try:
+        return tomllib.load(f)
+    finally:
+        f.close()
+
+
+def stage_project(project, executor, previous=None):
+    """Run the setup script of a project and stage the distribution.
+
+    Must be called from the main thread. Returns the finalized
+    bdist_osxinst command object (with all paths being absolute).
+    previous is the Distribution object of the previously staged project
+    (if any). run_setup() returns that object again if the setup script
+    doesn't call setup().
+    """
+    cwd = os.getcwd()
+    sys_path = sys.path[:]
+    os.chdir(project.path)
+    try:
+        sys.path.insert(0, project.path)
+        dist = run_setup(project.setup_script, script_args=[], stop_after="config")
+        if dist is previous or dist.script_name!=os.path.basename(project.setup_script):
+            raise DistutilsError("%s didn't call setup()"%project.setup_script)
+        project.distribution = dist
+        dist.cmdclass["bdist_osxinst"] = bdist_osxinst
+        opts = dist.get_option_dict("bdist_osxinst")
+        for key,value in project.options.items():
+            opts[key.replace("-", "_")] = (project.name, value)
+        cmd = dist.get_command_obj("bdist_osxinst")
+        cmd.ensure_finalized()
+        cmd.make_paths_absolute()
+        cmd.executor = executor
+        cmd.check_platform()
+        if not cmd.metadata_only:
+            cmd.stage_distribution()
+        return cmd
+    finally:
+        sys.path[:] = sys_path
+        os.chdir(cwd)
+
+
+def build_projects(projects, jobs=None):
+    """Build the installer packages of all projects.
+
+    The product, error and seconds attributes of the Project objects
+    are set. Returns the number of failed projects.
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    log.info("building %d projects using %d jobs"%(len(projects), jobs))
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=jobs)
+    # The remaining steps of every project are run by their own thread,
+    # they mostly wait for the component packages built by the shared executor.
+    project_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(projects)))
+    try:
+        futures = []
+        previous = None
+        for project in projects:
+            log.info("staging %s (%s)"%(project.name, project.path))
+            t0 = time.time()
+            try:
+                cmd = stage_project(project, executor, previous)
+            # (any error of a setup script only fails its own project)
+            except (Exception, SystemExit) as exc:
+                project.error = str(exc) or exc.__class__.__name__
+                project.seconds = time.time()-t0
+                log.error("%s: %s"%(project.name, project.error))
+                log.debug(traceback.format_exc())
+                continue
+            finally:
+                if project.distribution is not None:
+                    previous = project.distribution
+            futures.append(project_executor.submit(_finish_project, project, cmd, t0))
+        concurrent.futures.wait(futures)
+    finally:
+        project_executor.shutdown(wait=True)
+        executor.shutdown(wait=True)
+    return len([p for p in projects if p.error is not None])
+
+
+def _finish_project(project, cmd, t0):
+    try:
+        cmd.run()
+        project.product = cmd.get_product_pkg_name()
+    except (Exception, SystemExit) as exc:
+        project.error = str(exc) or exc.__class__.__name__
+        log.error("%s: %s"%(project.name, project.error))
+        log.debug(traceback.format_exc())
+    project.seconds = time.time()-t0
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog="python -m bdist_osxinst.batch",
+                                     description="Build the OSX installer packages of several distributions.")
+    parser.add_argument("project_file", help="TOML (or ini) file listing the projects")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of component packages to build in parallel (default: from the project file or the number of CPUs)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only log warnings and errors")
+    options = parser.parse_args(args)
+
+    log.set_verbosity(0 if options.quiet else 1)
+    jobs,projects = read_project_file(options.project_file)
+    if options.jobs is not None:
+        jobs = options.jobs
+    failed = build_projects(projects, jobs)
+
+    print("")
+    for project in projects:
+        if project.error is None:
+            print("%-20s ok      %7.1fs  %s"%(project.name, project.seconds, project.product))
+        else:
+            print("%-20s FAILED  %7.1fs  %s"%(project.name, project.seconds or 0, project.error))
+    if failed:
+        print("%d of %d projects failed"%(failed, len(projects)))
+        return 1
+    return 0
+
+
+if __name__=="__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+# Writer for Bom ("bill of materials") files as used in OSX installer packages
+#
+# Notes: The format is undocumented. The layout follows the description
+#        and the mkbom implementation of the bomutils project
+#        (https://github.com/hogliux/bomutils). mkbom always writes an empty
+#        hard link index (HLIndex). Here, every group of hard links gets
+#        an entry whose first index refers to a tree of the paths in the
+#        group (with the same records as the Paths tree) and whose second
+#        index refers to a block with the path ID of the first file of the
+#        group.
+
+import struct, stat, zlib
+
+# Entry types in a BOMPathInfo2 record
+TYPE_FILE = 1
+TYPE_DIR = 2
+TYPE_LINK = 3
+TYPE_DEV = 4
+
+# Maximum number of paths stored in a single leaf of the paths tree
+PATHS_PER_LEAF = 256
+
+# Table that reverses the bit order of a byte (used by Cksum)
+_REVERSED_BITS = bytes(bytearray(int("{0:08b}".format(i)[::-1], 2) for i in range(256)))
+
+
+class Cksum:
+    """Incremental computation of the POSIX cksum checksum.
+
+    This is the checksum that is stored for every file in a Bom. The
+    cksum CRC uses the same polynomial as zlib's crc32, just without bit
+    reflection, so the data is bit-reversed and run through zlib.crc32()
+    which is a lot faster than a pure Python implementation.
+    """
+    def __init__(self):
+        # The zlib crc32 value that corresponds to a zero CRC register
+        self._crc = 0xffffffff
+        self.length = 0
+
+    def update(self, data):
+        self._crc = zlib.crc32(data.translate(_REVERSED_BITS), self._crc) & 0xffffffff
+        self.length += len(data)
+
+    def value(self):
+        """Return the checksum of the data passed to update() so far.
+        """
+        # cksum appends the data length (least significant byte first)
+        n = self.length
+        tail = bytearray()
+        while n:
+            tail.append(n & 0xff)
+            n >>= 8
+        crc = zlib.crc32(bytes(tail).translate(_REVERSED_BITS), self._crc) & 0xffffffff
+        reg = _reverse32(crc ^ 0xffffffff)
+        return (~reg) & 0xffffffff
+
+
+class BomEntry:
+    """Describes one path that gets stored in a Bom.
+    """
+    def __init__(self, path, st, checksum=0, link_target=None):
+        # The relative path (such as "." or "./foo/bar.py")
+        self.path = path
+        # The os.stat_result of the file
+        self.st = st
+        # The cksum value of the file content (or of the link target)
+        self.checksum = checksum
+        # The target of a symbolic link (bytes) or None
+        self.link_target = link_target
+
+
+def build_bom(entries, links=None):
+    """Return the content of a Bom file as a bytes object.
+
+    entries is a sequence of BomEntry objects. The first entry must be the
+    root directory ".", and parent directories must appear before their
+    contents. links is a dict that maps the paths of files that are stored
+    as hard links to the path of the first file of their group (see
+    native.find_links()). The groups are stored in the hard link index.
+    """
+    store = _BomStore()
+
+    # Create the path records...
+    ids = {}
+    records = []
+    for i,entry in enumerate(entries):
+        path_id = i+1
+        ids[entry.path] = path_id
+        if entry.path==".":
+            parent_id = 0
+            name = "."
+        else:
+            parent_path,_,name = entry.path.rpartition("/")
+            parent_id = ids[parent_path]
+        info2 = store.add(_path_info2(entry))
+        info1 = store.add(struct.pack(">II", path_id, info2))
+        file_rec = store.add(struct.pack(">I", parent_id) + _encode(name) + b"\0")
+        records.append((info1, file_rec))
+
+    # Group the path records of the hard links...
+    link_groups = {}
+    if links:
+        for entry,record in zip(entries, records):
+            first = links.get(entry.path)
+            if first is not None:
+                link_groups.setdefault(first, []).append(record)
+
+    paths_tree = _build_tree(store, records, 4096)
+
+    # BomInfo
+    bom_info = struct.pack(">III", 1, len(records)+1, 1) + struct.pack(">IIII", 0, 0, 0, 0)
+    info_block = store.add(bom_info)
+    # Hard link index
+    hl_records = []
+    for first,group in link_groups.items():
+        group_tree = _build_tree(store, group, 4096)
+        hl_records.append((group_tree, store.add(struct.pack(">I", ids[first]))))
+    hl_tree = _build_tree(store, hl_records, 4096)
+    # VIndex
+    v_tree = _build_tree(store, [], 128)
+    v_index = store.add(struct.pack(">IIIB", 1, v_tree, 0, 0))
+    # Size64
+    size_tree = _build_tree(store, [], 128)
+
+    return store.tobytes([("BomInfo", info_block),
+                          ("Paths", paths_tree),
+                          ("HLIndex", hl_tree),
+                          ("VIndex", v_index),
+                          ("Size64", size_tree)])
+
+
+class _BomStore:
+    """Collects the blocks of a Bom file.
+    """
+    def __init__(self):
+        # Block 0 is always the null block
+        self.blocks = [b""]
+
+    def add(self, data):
+        self.blocks.append(data)
+        return len(self.blocks)-1
+
+    def set(self, index, data):
+        self.blocks[index] = data
+
+    def tobytes(self, vars):
+        header_size = 512
+        body = bytearray()
+        pointers = [(0, 0)]
+        offset = header_size
+        for data in self.blocks[1:]:
+            pointers.append((offset, len(data)))
+            body += data
+            offset += len(data)
+
+        vars_data = struct.pack(">I", len(vars))
+        for name,index in vars:
+            encoded = _encode(name)
+            vars_data += struct.pack(">IB", index, len(encoded)) + encoded
+        vars_offset = offset
+
+        index_data = struct.pack(">I", len(pointers))
+        for address,length in pointers:
+            index_data += struct.pack(">II", address, length)
+        # Free list (two empty entries)
+        index_data += struct.pack(">I", 2) + struct.pack(">IIII", 0, 0, 0, 0)
+        index_offset = vars_offset + len(vars_data)
+
+        header = b"BOMStore" + struct.pack(">IIIIII", 1, len(pointers)-1,
+                                           index_offset, len(index_data),
+                                           vars_offset, len(vars_data))
+        header += b"\0"*(header_size-len(header))
+        return header + bytes(body) + vars_data + index_data
+
+
+def _build_tree(store, records, block_size):
+    """Add a BOMTree (and its BOMPaths nodes) and return the block index of the tree.
+
+    records is a list of (index0, index1) tuples.
+    """
+    tree = store.add(b"")
+    leaves = [records[i:i+PATHS_PER_LEAF] for i in range(0, len(records), PATHS_PER_LEAF)] or [[]]
+    leaf_ids = [store.add(b"") for leaf in leaves]
+    for i,leaf in enumerate(leaves):
+        forward = leaf_ids[i+1] if i+1<len(leaves) else 0
+        backward = leaf_ids[i-1] if i>0 else 0
+        store.set(leaf_ids[i], _paths_node(True, leaf, forward, backward, block_size))
+
+    if len(leaves)==1:
+        child = leaf_ids[0]
+    else:
+        # Non-leaf root node that refers to the leaves (and to the last key of every leaf)
+        child = store.add(_paths_node(False, [(leaf_ids[i], leaf[-1][1]) for i,leaf in enumerate(leaves)], 0, 0, block_size))
+
+    store.set(tree, b"tree" + struct.pack(">IIIIB", 1, child, block_size, len(records), 0))
+    return tree
+
+
+def _paths_node(is_leaf, indices, forward, backward, block_size):
+    data = struct.pack(">HHII", int(is_leaf), len(indices), forward, backward)
+    for index0,index1 in indices:
+        data += struct.pack(">II", index0, index1)
+    if len(data)<block_size:
+        data += b"\0"*(block_size-len(data))
+    return data
+
+
+def _path_info2(entry):
+    st = entry.st
+    if stat.S_ISDIR(st.st_mode):
+        type = TYPE_DIR
+    elif stat.S_ISLNK(st.st_mode):
+        type = TYPE_LINK
+    elif stat.S_ISREG(st.st_mode):
+        type = TYPE_FILE
+    else:
+        type = TYPE_DEV
+    size = st.st_size if type in (TYPE_FILE, TYPE_LINK) else 0
+    data = struct.pack(">BBHHIIIIBI", type, 1, 3, st.st_mode & 0xffff, 0, 0,
+                       int(st.st_mtime) & 0xffffffff, size & 0xffffffff, 1,
+                       entry.checksum if type!=TYPE_DIR else 0)
+    if type==TYPE_LINK:
+        link = entry.link_target + b"\0"
+        data += struct.pack(">I", len(link)) + link
+    else:
+        data += struct.pack(">I", 0)
+    return data
+
+
+def _encode(name):
+    if isinstance(name, bytes):
+        return name
+    return name.encode("utf-8")
+
+
+def _reverse32(x):
+    return int("{0:032b}".format(x)[::-1], 2)
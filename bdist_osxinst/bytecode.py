@@ -0,0 +1,245 @@
+# Byte-compiling the staged modules
+#
+# distutils byte-compiles the installed modules one after another. The
+# functions in this module compile them in several worker processes instead
+# (python -m bdist_osxinst.bytecode, so the setup script isn't run again in
+# the workers). The byte-code files can be kept in a cache directory that is
+# keyed by the hash of the source, so modules whose source didn't change
+# since the previous build aren't compiled again. Byte-code files that are
+# already up to date (when the stage area has been kept) are left alone.
+#
+# make_sourceless() turns a staged tree into a byte-code only tree (for
+# packages that should be installed without their sources).
+
+import sys, os, os.path, stat, json, time, hashlib, importlib.util, py_compile, shutil, subprocess, tempfile
+
+# The Python source files are only compiled in worker processes if there
+# are at least this many compilations to do
+MIN_PARALLEL_FILES = 20
+
+
+def byte_compile(files, prefix, levels, cache_dir=None, jobs=None):
+    """Byte-compile the Python modules in files for every optimization level in levels.
+
+    prefix is removed from the file names to get the file names that
+    are stored in the byte-code (this is the root of the stage area). If
+    cache_dir is given, the byte-code files are taken from (and added to)
+    the cache in this directory. jobs is the number of worker processes
+    (default: the number of CPUs).
+    Returns a tuple (compiled, cached, errors) with the number of files
+    that were compiled, the number of files taken from the cache (or
+    that were already up to date) and a list of error messages (of modules that couldn't be compiled, such
+    as modules with syntax errors).
+    """
+    tasks = []
+    for file_name in files:
+        if not file_name.startswith(prefix):
+            raise ValueError("invalid prefix: file name %r doesn't start with %r"%(file_name, prefix))
+        for level in levels:
+            tasks.append((file_name, file_name[len(prefix):], level))
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(tasks)//MIN_PARALLEL_FILES)
+    if jobs<=1:
+        results = [compile_file(file_name, dfile, level, cache_dir) for file_name,dfile,level in tasks]
+    else:
+        results = _run_workers(tasks, cache_dir, jobs)
+    compiled = len([r for r in results if r=="compiled"])
+    cached = len([r for r in results if r=="cached"])
+    errors = [r for r in results if r not in ["compiled", "cached"]]
+    return compiled, cached, errors
+
+
+def compile_file(file_name, dfile, level, cache_dir=None):
+    """Byte-compile one module.
+
+    Returns "compiled", "cached" (if the byte-code was taken from the
+    cache or was already up to date) or an error message.
+    """
+    cfile = importlib.util.cache_from_source(file_name, optimization=level or "")
+    up_to_date = _is_up_to_date(file_name, cfile)
+    cache_name = None
+    if cache_dir is not None:
+        f = open(file_name, "rb")
+        source = f.read()
+        f.close()
+        h = hashlib.sha1(source)
+        h.update(("\0%s\0%d\0"%(dfile, level)).encode("utf-8") + importlib.util.MAGIC_NUMBER)
+        key = h.hexdigest()
+        cache_name = os.path.join(cache_dir, key[:2], key+".pyc")
+        if os.path.exists(cache_name):
+            if not up_to_date:
+                _copy_cached(cache_name, file_name, cfile)
+            _mark_used(cache_name)
+            return "cached"
+    if not up_to_date:
+        try:
+            py_compile.compile(file_name, cfile, dfile, doraise=True, optimize=level)
+        except py_compile.PyCompileError as exc:
+            return exc.msg
+    if cache_name is not None:
+        if not os.path.exists(os.path.dirname(cache_name)):
+            try:
+                os.makedirs(os.path.dirname(cache_name))
+            except OSError:
+                # Created by another worker
+                pass
+        # (written to a temporary file first, so the cache never contains partial files)
+        fd,tmp_name = tempfile.mkstemp(dir=os.path.dirname(cache_name))
+        os.close(fd)
+        shutil.copyfile(cfile, tmp_name)
+        os.replace(tmp_name, cache_name)
+    if up_to_date:
+        return "cached"
+    return "compiled"
+
+
+def make_sourceless(root, install_location):
+    """Replace the Python sources below root by their byte-code.
+
+    Every module foo.py is replaced by foo.pyc (the legacy location which
+    Python imports from when there is no source). The byte-code is taken
+    from __pycache__ if it has been compiled already and compiled
+    otherwise (with the file name the module will have below
+    install_location). The __pycache__ directories are removed.
+    Returns a tuple (bytes_before, bytes_after) with the total size of the
+    regular files in the tree before and after the conversion.
+    """
+    bytes_before = _tree_bytes(root)
+    for dir_path,dir_names,file_names in os.walk(root):
+        for name in file_names:
+            if not name.endswith(".py"):
+                continue
+            file_name = os.path.join(dir_path, name)
+            cfile = importlib.util.cache_from_source(file_name, optimization="")
+            if not os.path.exists(cfile):
+                dfile = os.path.join(install_location, os.path.relpath(file_name, root))
+                py_compile.compile(file_name, cfile, dfile, doraise=True)
+            os.replace(cfile, file_name[:-3]+".pyc")
+            os.remove(file_name)
+        if "__pycache__" in dir_names:
+            dir_names.remove("__pycache__")
+            shutil.rmtree(os.path.join(dir_path, "__pycache__"))
+    return bytes_before,_tree_bytes(root)
+
+
+def _tree_bytes(root):
+    total = 0
+    for dir_path,dir_names,file_names in os.walk(root):
+        for name in file_names:
+            st = os.lstat(os.path.join(dir_path, name))
+            if stat.S_ISREG(st.st_mode):
+                total += st.st_size
+    return total
+
+
+def prune_cache(cache_dir, max_age_time):
+    """Remove the byte-code files from the cache that haven't been used since max_age_time.
+    """
+    if not os.path.exists(cache_dir):
+        return
+    for dir_path,dir_names,file_names in os.walk(cache_dir):
+        for name in file_names:
+            path = os.path.join(dir_path, name)
+            if os.path.getatime(path)<max_age_time:
+                os.remove(path)
+
+
+def _is_up_to_date(file_name, cfile):
+    """Return True if the byte-code file cfile matches the current source file_name.
+    
+    This is the same check the import system does (magic number, source
+    modification time and source size in the header).
+    """
+    try:
+        f = open(cfile, "rb")
+    except (IOError, OSError):
+        return False
+    try:
+        header = f.read(16)
+    finally:
+        f.close()
+    if len(header)<16 or header[:4]!=importlib.util.MAGIC_NUMBER or header[4:8]!=b"\0\0\0\0":
+        return False
+    st = os.stat(file_name)
+    return (header[8:12]==(int(st.st_mtime) & 0xffffffff).to_bytes(4, "little") and
+            header[12:16]==(st.st_size & 0xffffffff).to_bytes(4, "little"))
+
+
+def _mark_used(cache_name):
+    # The access time marks the last use of a cache entry (see prune_cache()),
+    # the modification time is kept, as it is copied to the byte-code files
+    # taken from the cache
+    st = os.stat(cache_name)
+    os.utime(cache_name, (time.time(), st.st_mtime))
+
+
+def _copy_cached(cache_name, file_name, cfile):
+    """Copy a cached byte-code file and update the source timestamp in its header.
+    
+    The copy gets the modification time of the cache entry, so the
+    byte-code file looks the same in every build.
+    """
+    f = open(cache_name, "rb")
+    data = bytearray(f.read())
+    f.close()
+    # Header: magic, flags, source mtime, source size (the last two are
+    # only used if the flags are 0, otherwise the header contains the hash
+    # of the source)
+    if data[4:8]==b"\0\0\0\0":
+        st = os.stat(file_name)
+        data[8:12] = (int(st.st_mtime) & 0xffffffff).to_bytes(4, "little")
+        data[12:16] = (st.st_size & 0xffffffff).to_bytes(4, "little")
+    if not os.path.exists(os.path.dirname(cfile)):
+        os.makedirs(os.path.dirname(cfile))
+    f = open(cfile, "wb")
+    f.write(data)
+    f.close()
+    # (only the times are copied, the cache entries aren't readable by everyone)
+    st = os.stat(cache_name)
+    os.utime(cfile, (st.st_atime, st.st_mtime))
+
+
+def _run_workers(tasks, cache_dir, jobs):
+    """Run the compilation tasks in jobs worker processes and return the results.
+    """
+    env = dict(os.environ)
+    # The workers must be able to import this package
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join([package_parent]+[p for p in [env.get("PYTHONPATH")] if p])
+    procs = []
+    try:
+        for i in range(jobs):
+            proc = subprocess.Popen([sys.executable, "-m", "bdist_osxinst.bytecode"], env=env,
+                                    stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            procs.append(proc)
+            # Every worker gets every jobs-th task (the workers read all
+            # their tasks before they start)
+            proc.stdin.write(json.dumps({"cache_dir": cache_dir, "tasks": tasks[i::jobs]}).encode("utf-8"))
+            proc.stdin.close()
+        worker_results = []
+        for proc in procs:
+            out = proc.stdout.read()
+            proc.stdout.close()
+            if proc.wait()!=0:
+                raise OSError("byte-compiling worker failed with exit status %d"%proc.returncode)
+            worker_results.append(json.loads(out.decode("utf-8")))
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+    results = [None]*len(tasks)
+    for i,res in enumerate(worker_results):
+        results[i::jobs] = res
+    return results
+
+
+def _worker_main():
+    data = json.loads(sys.stdin.buffer.read().decode("utf-8"))
+    results = [compile_file(file_name, dfile, level, data["cache_dir"]) for file_name,dfile,level in data["tasks"]]
+    sys.stdout.buffer.write(json.dumps(results).encode("utf-8"))
+
+
+if __name__=="__main__":
+    _worker_main()
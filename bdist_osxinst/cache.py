@@ -0,0 +1,194 @@
+# Caching of component packages between builds
+
+import os, os.path, stat, hashlib, shutil, tempfile, time
+from .manifest import CHUNK_SIZE, file_digests
+
+# Temporary files in the shared cache that are older than this (in seconds)
+# are left overs from crashed builds and may be removed.
+STALE_TMP_AGE = 24*60*60
+
+
+def tree_fingerprint(manifest, params):
+    """Return a fingerprint (hex digest) of a directory tree.
+
+    manifest is the Manifest object of the tree. The fingerprint covers
+    the relative paths, types, permissions, sizes and contents of all
+    files in the manifest (the digests of the manifest are used if they
+    have been computed). Modification times are ignored as they change
+    whenever the stage area is recreated (or the modules are byte-compiled
+    again), so the fingerprint is the same on every build and every
+    machine that stages the same files. params is a sequence of
+    additional strings that are included in the fingerprint (such as the
+    package identifier).
+    """
+    h = hashlib.sha1()
+    for param in params:
+        h.update(("%s\0"%param).encode("utf-8"))
+    for path,st in manifest.iter_tree():
+        h.update(os.fsencode(path) + b"\0")
+        if stat.S_ISDIR(st.st_mode):
+            h.update(("%o\0"%st.st_mode).encode("ascii"))
+        elif stat.S_ISLNK(st.st_mode):
+            h.update(os.fsencode(os.readlink(os.path.join(manifest.root, path))) + b"\0")
+        else:
+            h.update(("%o %d "%(st.st_mode, st.st_size)).encode("ascii"))
+            if manifest.digests is not None and path in manifest.digests:
+                digest = manifest.digests[path][0]
+            else:
+                digest = file_digests(os.path.join(manifest.root, path), cksum=False)[0]
+            h.update(digest.encode("ascii") + b"\0")
+    return h.hexdigest()
+
+
+class BuildCache:
+    """Component packages from previous builds.
+
+    The cache keeps the last built version of every component package
+    together with the fingerprint of its inputs. The packages are stored
+    under their file name (such as "pkg.foo.pkg") in cache_dir.
+    """
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def fetch(self, name, fingerprint, dst):
+        """Copy the cached package to dst if its fingerprint matches.
+
+        Returns True if the package was found and copied.
+        """
+        pkg_file = os.path.join(self.cache_dir, name)
+        if self._read_fingerprint(name)!=fingerprint or not os.path.exists(pkg_file):
+            return False
+        shutil.copyfile(pkg_file, dst)
+        return True
+
+    def store(self, name, fingerprint, src):
+        """Put the package src into the cache.
+        """
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        # Remove the old fingerprint first, so that an interrupted update
+        # never leaves a valid fingerprint next to a wrong package.
+        fingerprint_file = os.path.join(self.cache_dir, name+".fingerprint")
+        if os.path.exists(fingerprint_file):
+            os.remove(fingerprint_file)
+        shutil.copyfile(src, os.path.join(self.cache_dir, name))
+        f = open(fingerprint_file, "wt")
+        f.write(fingerprint)
+        f.close()
+
+    def _read_fingerprint(self, name):
+        fingerprint_file = os.path.join(self.cache_dir, name+".fingerprint")
+        if not os.path.exists(fingerprint_file):
+            return None
+        f = open(fingerprint_file, "rt")
+        fingerprint = f.read().strip()
+        f.close()
+        return fingerprint
+
+
+class SharedPackageCache:
+    """Content-addressed cache of component packages.
+
+    The packages are stored under the hash of their inputs (see
+    tree_fingerprint()), so the cache can be shared by
+    several projects and build machines (e.g. on a network mount).
+    New packages are written to a temporary file first and then renamed,
+    so readers never see incomplete packages. If max_size (in bytes) is
+    not None, evict() removes the least recently used packages when the
+    cache has grown beyond that size. store() doesn't call it, since it
+    walks the whole cache; call it once after storing new packages.
+    """
+    def __init__(self, cache_dir, max_size=None):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    def get_path(self, key):
+        """Return the file name under which the package with the given key is stored.
+        """
+        return os.path.join(self.cache_dir, key[:2], key+".pkg")
+
+    def fetch(self, key, dst):
+        """Copy the package with the given key to dst.
+
+        Returns True if the package was found in the cache.
+        """
+        pkg_file = self.get_path(key)
+        try:
+            shutil.copyfile(pkg_file, dst)
+        except (IOError, OSError):
+            # Not in the cache (or evicted by another build in the meantime)
+            return False
+        self._touch(pkg_file)
+        return True
+
+    def store(self, key, src):
+        """Add the package src to the cache under the given key.
+        """
+        pkg_file = self.get_path(key)
+        if os.path.exists(pkg_file):
+            self._touch(pkg_file)
+            return
+        dir_name = os.path.dirname(pkg_file)
+        if not os.path.exists(dir_name):
+            try:
+                os.makedirs(dir_name)
+            except OSError:
+                # Another build may have created it in the meantime
+                if not os.path.isdir(dir_name):
+                    raise
+        fd,tmp_name = tempfile.mkstemp(suffix=".tmp", dir=dir_name)
+        try:
+            dst = os.fdopen(fd, "wb")
+            src_file = open(src, "rb")
+            try:
+                shutil.copyfileobj(src_file, dst, CHUNK_SIZE)
+            finally:
+                src_file.close()
+                dst.close()
+            os.rename(tmp_name, pkg_file)
+        except:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
+
+    def evict(self):
+        """Remove the least recently used packages until the cache fits into max_size.
+        """
+        if self.max_size is None or not os.path.isdir(self.cache_dir):
+            return
+        now = time.time()
+        pkg_files = []
+        total_size = 0
+        for dir_path,dir_names,file_names in os.walk(self.cache_dir):
+            for name in file_names:
+                path = os.path.join(dir_path, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if name.endswith(".pkg"):
+                    pkg_files.append((st.st_mtime, st.st_size, path))
+                    total_size += st.st_size
+                elif name.endswith(".tmp") and now-st.st_mtime>STALE_TMP_AGE:
+                    self._remove(path)
+
+        pkg_files.sort()
+        for mtime,size,path in pkg_files:
+            if total_size<=self.max_size:
+                break
+            if self._remove(path):
+                total_size -= size
+
+    def _touch(self, path):
+        # The modification time marks the last use of a package
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+        return True
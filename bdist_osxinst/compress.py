@@ -0,0 +1,198 @@
+# Compression of package payloads
+#
+# The payload of a component package is a gzip compressed cpio archive.
+# This module provides the streams used to write the compressed payload:
+#
+#   gzip   - a plain gzip stream (zlib, single-threaded)
+#   pgzip  - a block-parallel gzip stream (like pigz). The data is split into
+#            blocks that are deflated by several threads at the same time
+#            (zlib releases the GIL while compressing). The blocks are
+#            flushed to a byte boundary and concatenated, so the result is
+#            a standard single-member gzip file that any gzip decoder (and
+#            the OSX Installer) can read.
+
+import os, struct, zlib, gzip, concurrent.futures
+from distutils.errors import DistutilsFileError
+
+# The available payload compression codecs
+COMPRESSION_CODECS = ["gzip", "pgzip"]
+# The default compression level
+DEFAULT_COMPRESSION_LEVEL = 9
+# Size of the blocks compressed by the threads of the pgzip codec
+PGZIP_BLOCK_SIZE = 1024*1024
+# Size of the window that primes the compression of the next block
+DEFLATE_WINDOW_SIZE = 32*1024
+# Size of the chunks used when recompressing payloads
+CHUNK_SIZE = 1024*1024
+
+
+def open_compressor(fileobj, codec="gzip", level=DEFAULT_COMPRESSION_LEVEL, threads=None):
+    """Return a writable stream that compresses into the file object fileobj.
+
+    codec is one of COMPRESSION_CODECS, level is the compression level
+    (0-9). threads is the number of threads used by the pgzip codec
+    (default: the number of CPUs). Closing the returned stream finishes
+    the compressed data but doesn't close fileobj.
+    """
+    if codec=="gzip":
+        return gzip.GzipFile(filename="", mode="wb", fileobj=fileobj, compresslevel=level, mtime=0)
+    elif codec=="pgzip":
+        return ParallelGzipWriter(fileobj, level, threads)
+    else:
+        raise ValueError("invalid compression codec: %s"%codec)
+
+
+class ParallelGzipWriter:
+    """Writes a gzip stream whose blocks are compressed by several threads.
+
+    Each block is compressed as raw deflate data with the last 32KB of the
+    previous block as dictionary (so the compression ratio is nearly the
+    same as with a single stream). All blocks but the last one end with
+    a sync flush, so they can simply be concatenated. The number of blocks
+    that are buffered at the same time is limited to twice the number of
+    threads, so the memory usage doesn't depend on the size of the data.
+    """
+    def __init__(self, fileobj, level=DEFAULT_COMPRESSION_LEVEL, threads=None, block_size=PGZIP_BLOCK_SIZE):
+        if threads is None:
+            threads = os.cpu_count() or 1
+        self.fileobj = fileobj
+        self.level = level
+        self.block_size = block_size
+        self.max_pending = 2*threads
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=threads)
+        # Futures of the blocks that haven't been written yet (in order)
+        self._pending = []
+        self._buffer = []
+        self._buffer_size = 0
+        # The tail of the previous block (dictionary for the next block)
+        self._window = b""
+        self._crc = 0
+        self._size = 0
+        self._closed = False
+        # gzip header: magic, deflate, no flags, mtime 0, extra flags, OS "unknown"
+        xfl = 2 if level==9 else (4 if level==1 else 0)
+        self.fileobj.write(b"\x1f\x8b\x08\x00" + struct.pack("<I", 0) + bytes(bytearray([xfl, 255])))
+
+    def write(self, data):
+        if self._closed:
+            raise ValueError("write to closed stream")
+        data = bytes(data)
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        self._buffer.append(data)
+        self._buffer_size += len(data)
+        if self._buffer_size>=self.block_size:
+            block = b"".join(self._buffer)
+            end = len(block)-len(block)%self.block_size
+            for start in range(0, end, self.block_size):
+                self._submit(block[start:start+self.block_size], False)
+            self._buffer = [block[end:]]
+            self._buffer_size = len(block)-end
+        return len(data)
+
+    def flush(self):
+        self.fileobj.flush()
+
+    def close(self):
+        """Compress the remaining data and write the gzip trailer.
+        """
+        if self._closed:
+            return
+        try:
+            self._submit(b"".join(self._buffer), True)
+            self._buffer = []
+            while self._pending:
+                self._write_next()
+            self.fileobj.write(struct.pack("<II", self._crc & 0xffffffff, self._size & 0xffffffff))
+        finally:
+            self._closed = True
+            self._executor.shutdown(wait=True)
+
+    def abort(self):
+        """Stop compressing without finishing the gzip stream (e.g. after an error).
+        """
+        self._closed = True
+        for future in self._pending:
+            future.cancel()
+        self._pending = []
+        self._executor.shutdown(wait=True)
+
+    def _submit(self, block, last):
+        self._pending.append(self._executor.submit(_deflate_block, block, self._window, self.level, last))
+        if len(block)>=DEFLATE_WINDOW_SIZE:
+            self._window = block[-DEFLATE_WINDOW_SIZE:]
+        else:
+            self._window = (self._window+block)[-DEFLATE_WINDOW_SIZE:]
+        while len(self._pending)>self.max_pending:
+            self._write_next()
+
+    def _write_next(self):
+        self.fileobj.write(self._pending.pop(0).result())
+
+
+def _deflate_block(block, window, level, last):
+    """Return the raw deflate data of a block.
+    """
+    if window:
+        comp = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, 9, zlib.Z_DEFAULT_STRATEGY, window)
+    else:
+        comp = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, 9)
+    data = comp.compress(block)
+    return data + comp.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+def recompress_gzip(src_name, length, offset, dst_name, codec, level, threads=None):
+    """Decompress a gzip stream stored in a file and compress it again.
+
+    The gzip data is read from the file src_name (length bytes starting at
+    offset) and the result is written to dst_name. Both sides are streamed,
+    so the uncompressed data is never held in memory.
+    Returns the number of bytes written.
+    """
+    decomp = zlib.decompressobj(16+zlib.MAX_WBITS)
+    src = open(src_name, "rb")
+    dst = open(dst_name, "wb")
+    try:
+        out = open_compressor(dst, codec, level, threads)
+        try:
+            src.seek(offset)
+            remaining = length
+            while remaining>0:
+                data = src.read(min(CHUNK_SIZE, remaining))
+                if not data:
+                    raise DistutilsFileError("unexpected end of file: %s"%src_name)
+                remaining -= len(data)
+                out.write(decomp.decompress(data))
+            out.write(decomp.flush())
+            if not decomp.eof:
+                raise DistutilsFileError("truncated gzip data in %s"%src_name)
+        except:
+            abort_compressor(out)
+            raise
+        out.close()
+        size = dst.tell()
+    finally:
+        src.close()
+        dst.close()
+    return size
+
+
+def abort_compressor(stream):
+    """Stop a stream returned by open_compressor() after an error.
+
+    The compressed data is left unfinished (the output is expected to be
+    thrown away).
+    """
+    if hasattr(stream, "abort"):
+        stream.abort()
+
+
+def is_gzip(file_name, offset=0):
+    """Return True if the data at offset in the given file starts with the gzip magic number.
+    """
+    f = open(file_name, "rb")
+    try:
+        f.seek(offset)
+        return f.read(2)==b"\x1f\x8b"
+    finally:
+        f.close()
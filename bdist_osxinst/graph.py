@@ -0,0 +1,118 @@
+# Running the steps of a build as a dependency graph
+#
+# Some steps of a build depend on each other (the product package can only
+# be created when the component packages and the distribution xml file are
+# there), others don't (copying the resources, looking up file types with
+# mdls and building the component packages). TaskGraph starts every step as
+# soon as the steps it depends on have finished, so independent steps
+# overlap and the total time is determined by the longest chain of dependent
+# steps instead of the sum of all steps.
+#
+# The graph is driven by an asyncio event loop. The steps themselves are
+# ordinary (blocking) functions that are run by a thread pool.
+
+import asyncio, concurrent.futures
+
+
+class TaskGraph:
+    """A set of named tasks with dependencies.
+
+    Tasks are added with add() and run with run(). The return values of
+    the tasks are stored in the results dict (key: task name), so a task
+    can pick up the results of the tasks it depends on.
+    """
+    def __init__(self):
+        # key: task name, value: (func, names of the tasks it depends on)
+        self.tasks = {}
+        # The task names in the order they were added
+        self.order = []
+        # The return values of the finished tasks (key: task name)
+        self.results = {}
+
+    def add(self, name, func, deps=()):
+        """Add a task.
+
+        func is called without arguments once all tasks in deps have
+        finished. The dependencies must have been added before.
+        """
+        if name in self.tasks:
+            raise ValueError("duplicate task: %s"%name)
+        for dep in deps:
+            if dep not in self.tasks:
+                raise ValueError("task %s depends on the unknown task %s"%(name, dep))
+        self.tasks[name] = (func, list(deps))
+        self.order.append(name)
+
+    def run(self, max_workers=None, on_error=None):
+        """Run all tasks and return the results dict.
+
+        max_workers is the number of threads that run the tasks (default:
+        as many as there are tasks). If a task fails, no further tasks are
+        started and on_error is called (e.g. to cancel the commands that are
+        still running). The exception of the first failed task is raised
+        once the running tasks have finished.
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or max(1, len(self.tasks)))
+        try:
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(self._run(loop, executor, on_error))
+            finally:
+                loop.close()
+        finally:
+            executor.shutdown(wait=True)
+
+    async def _run(self, loop, executor, on_error):
+        futures = {}
+        failed = []
+
+        async def run_task(name):
+            func,deps = self.tasks[name]
+            for dep in deps:
+                # (raises the exception of the dependency if it failed)
+                await futures[dep]
+            if failed:
+                raise _Skipped(name)
+            self.results[name] = await loop.run_in_executor(executor, func)
+
+        for name in self.order:
+            futures[name] = loop.create_task(run_task(name))
+
+        error = None
+        pending = set(futures.values())
+        while pending:
+            done,pending = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+            for future in done:
+                exc = future.exception()
+                if exc is not None and error is None:
+                    error = exc
+                    failed.append(future)
+                    if on_error is not None:
+                        on_error()
+        if error is not None:
+            raise error
+        return self.results
+
+    def run_serial(self, on_error=None):
+        """Run all tasks one after another in the calling thread and return the results dict.
+
+        The tasks are run in the order they were added (so the dependencies
+        are always done first). This is used when all the work has to be
+        done by one thread, e.g. for profiling. If a task fails, on_error is
+        called and the exception is raised.
+        """
+        for name in self.order:
+            func,deps = self.tasks[name]
+            try:
+                self.results[name] = func()
+            except:
+                if on_error is not None:
+                    on_error()
+                raise
+        return self.results
+
+
+class _Skipped(Exception):
+    """Raised by the tasks that weren't started because another task failed.
+    """
+    pass
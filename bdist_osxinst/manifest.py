@@ -0,0 +1,194 @@
+# Inventory of the files in the stage area
+
+import os, os.path, stat, hashlib
+from .bom import Cksum
+
+# Size of the chunks used when reading (and hashing) files
+CHUNK_SIZE = 1024*1024
+
+
+class Manifest:
+    """The files and directories below a root directory.
+
+    The entries attribute is a list of (path, stat) tuples. The paths are
+    relative to root and have the form "." (root itself) or "./foo/bar".
+    The list is in pre-order, i.e. every directory is directly followed by
+    its (sorted) contents, so parents always appear before their children
+    and every sub-tree is a contiguous slice of the list. The stat values
+    are os.stat_result objects of the entries themselves (symbolic links
+    are not followed, except when root itself is a symbolic link).
+
+    A manifest is created by scanning the tree once (see scan()). The
+    manifests of sub-trees and filtered views are derived from it without
+    touching the file system again.
+
+    The digests of the file contents are only known after
+    compute_digests() has been called. They are passed on to the derived
+    manifests.
+    """
+    def __init__(self, root, entries, digests=None):
+        self.root = root
+        self.entries = entries
+        # The content digests of the regular files (key: path, value: tuple
+        # (sha1 hex digest, Bom cksum value)) or None if not computed yet
+        self.digests = digests
+        # Maps paths to their index in entries (created on demand)
+        self._index = None
+
+    @classmethod
+    def scan(cls, root):
+        """Create the manifest of the tree below root.
+        """
+        entries = [(".", os.stat(root))]
+        def scan_dir(dir_path, rel_path):
+            for dir_entry in sorted(os.scandir(dir_path), key=lambda e: e.name):
+                st = dir_entry.stat(follow_symlinks=False)
+                rel_name = "%s/%s"%(rel_path, dir_entry.name)
+                entries.append((rel_name, st))
+                if stat.S_ISDIR(st.st_mode):
+                    scan_dir(dir_entry.path, rel_name)
+        scan_dir(root, ".")
+        return cls(root, entries)
+
+    def iter_tree(self):
+        """Yield the (path, stat) tuples of all entries.
+        """
+        return iter(self.entries)
+
+    def get_stat(self, path):
+        """Return the stat of the entry with the given relative path or None.
+        """
+        if self._index is None:
+            self._index = dict((p, i) for i,(p,st) in enumerate(self.entries))
+        i = self._index.get(path)
+        if i is None:
+            return None
+        return self.entries[i][1]
+
+    def top_level(self):
+        """Return the (name, stat) tuples of the entries directly inside root.
+        """
+        return [(path[2:], st) for path,st in self.entries[1:] if path.count("/")==1]
+
+    def subtree(self, name):
+        """Return the manifest of the directory name (directly inside root).
+        """
+        st = self.get_stat("./%s"%name)
+        if st is None or not stat.S_ISDIR(st.st_mode):
+            raise ValueError("not a directory in the manifest: %s"%name)
+        start = self._index["./%s"%name]
+        prefix = "./%s/"%name
+        entries = [(".", st)]
+        for path,st in self.entries[start+1:]:
+            if not path.startswith(prefix):
+                break
+            entries.append(("./"+path[len(prefix):], st))
+        digests = None
+        if self.digests is not None:
+            digests = dict(("./"+path[len(prefix):], digest) for path,digest in self.digests.items() if path.startswith(prefix))
+        return Manifest(os.path.join(self.root, name), entries, digests)
+
+    def filter(self, include=None, exclude=None):
+        """Return a manifest that only contains some of the entries directly inside root.
+
+        include is a list of names that should be kept (None means all
+        entries), exclude is a list of names that should be left out.
+        """
+        if include is None and exclude is None:
+            return self
+        entries = [self.entries[0]]
+        for path,st in self.entries[1:]:
+            name = path[2:].split("/", 1)[0]
+            if include is not None and name not in include:
+                continue
+            if exclude is not None and name in exclude:
+                continue
+            entries.append((path, st))
+        return Manifest(self.root, entries, self.digests)
+
+    def num_files(self):
+        """Return the number of regular files.
+        """
+        return sum(1 for path,st in self.entries if stat.S_ISREG(st.st_mode))
+
+    def total_bytes(self):
+        """Return the total size of all regular files.
+        """
+        return sum(st.st_size for path,st in self.entries if stat.S_ISREG(st.st_mode))
+
+    def compute_digests(self, executor=None):
+        """Hash the contents of all regular files and set the digests attribute.
+
+        The files are hashed by the threads of executor (a
+        concurrent.futures executor) if given. Every file is read once for
+        both the sha1 digest and the Bom checksum.
+        """
+        paths = [path for path,st in self.entries if stat.S_ISREG(st.st_mode)]
+        file_names = [os.path.join(self.root, path) for path in paths]
+        if executor is None:
+            results = map(file_digests, file_names)
+        else:
+            results = executor.map(file_digests, file_names)
+        self.digests = dict(zip(paths, results))
+
+    def write(self, filename):
+        """Write the manifest as a text file.
+
+        Every line describes one entry: the path, the mode (octal), the size
+        and the sha1 digest of the content ("-" for everything but regular
+        files or if the digests haven't been computed), separated by tabs.
+        """
+        f = open(filename, "wt")
+        try:
+            for path,st in self.entries:
+                digest = "-"
+                if self.digests is not None and path in self.digests:
+                    digest = self.digests[path][0]
+                size = st.st_size if stat.S_ISREG(st.st_mode) else 0
+                f.write("%s\t%o\t%d\t%s\n"%(path, st.st_mode, size, digest))
+        finally:
+            f.close()
+
+
+def file_digests(file_name, cksum=True):
+    """Return a tuple (sha1 hex digest, Bom cksum value) of the content of a file.
+
+    If cksum is False, only the sha1 digest is computed and the cksum
+    value is None.
+    """
+    h = hashlib.sha1()
+    cksum = Cksum() if cksum else None
+    f = open(file_name, "rb")
+    try:
+        while True:
+            data = f.read(CHUNK_SIZE)
+            if not data:
+                break
+            h.update(data)
+            if cksum is not None:
+                cksum.update(data)
+    finally:
+        f.close()
+    return h.hexdigest(),(cksum.value() if cksum is not None else None)
+
+
+def find_duplicates(manifests):
+    """Return the files whose content appears more than once.
+
+    manifests is a list of (name, Manifest) tuples whose digests have
+    been computed. Returns a list of (size, sha1 digest, locations)
+    tuples, one for each content that was found more than once (empty
+    files are ignored). locations is the list of (name, path) tuples
+    where the content was found. The list is sorted by the number of bytes
+    that could be saved (largest first).
+    """
+    groups = {}
+    for name,manifest in manifests:
+        for path,st in manifest.entries:
+            if not stat.S_ISREG(st.st_mode) or st.st_size==0:
+                continue
+            sha1 = manifest.digests[path][0]
+            groups.setdefault((st.st_size, sha1), []).append((name, path))
+    duplicates = [(size, sha1, locations) for (size, sha1),locations in groups.items() if len(locations)>1]
+    duplicates.sort(key=lambda d: (-d[0]*(len(d[2])-1), d[2]))
+    return duplicates
@@ -0,0 +1,344 @@
+# Native (pure Python) creation of flat OSX component packages
+#
+# A flat component package is a xar archive with the following members:
+#
+#   Bom          - the bill of materials (see bom.py)
+#   Payload      - a gzip compressed cpio archive (odc format) with the files
+#   PackageInfo  - an xml file with the package identifier, version, etc.
+#
+# This module writes those packages directly, so component packages can
+# be built on platforms where pkgbuild isn't available. It also writes the
+# product archive (the equivalent of productbuild) which is a xar archive
+# containing the Distribution file, the Resources directory and one
+# directory per component package holding the members listed above.
+
+import os, os.path, stat, hashlib
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import quoteattr
+from distutils.errors import DistutilsExecError, DistutilsFileError
+from distutils import log
+from . import xar
+from .bom import BomEntry, Cksum, build_bom
+from .manifest import Manifest, CHUNK_SIZE, file_digests
+from .compress import open_compressor, abort_compressor, recompress_gzip, is_gzip, DEFAULT_COMPRESSION_LEVEL
+
+# The largest file size that can be stored in an odc cpio header (11 octal digits)
+CPIO_MAX_FILE_SIZE = 0o77777777777
+# Version string written into PackageInfo
+GENERATOR_VERSION = "bdist_osxinst"
+
+
+class _HashingWriter:
+    """File wrapper that computes the sha1 digest and size of the written data.
+    """
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.sha1 = hashlib.sha1()
+        self.size = 0
+
+    def write(self, data):
+        self.fileobj.write(data)
+        self.sha1.update(data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        self.fileobj.flush()
+
+
+def write_payload(filename, manifest, cancel_event=None, codec="gzip", level=DEFAULT_COMPRESSION_LEVEL, links=None):
+    """Write the gzip compressed cpio archive containing the files of a manifest.
+
+    manifest is a Manifest object describing the files that get archived.
+    codec and level select the compression (see compress.open_compressor()).
+    The archive is compressed while it is written, so it never exists
+    uncompressed. links is the result of find_links() if files with the
+    same content should be stored as hard links.
+
+    Returns a tuple (sha1, bom_entries, install_kbytes) where sha1 is the
+    hex digest of the written (compressed) file and bom_entries is a list
+    of BomEntry objects describing the archived paths.
+    If cancel_event is set while the payload is written, a
+    DistutilsExecError exception is raised.
+    """
+    bom_entries = []
+    raw = open(filename, "wb")
+    try:
+        hashed = _HashingWriter(raw)
+        out = open_compressor(hashed, codec, level)
+        try:
+            total_size = _write_cpio_entries(out, manifest, bom_entries, cancel_event, links)
+        except:
+            abort_compressor(out)
+            raise
+        out.close()
+    finally:
+        raw.close()
+    install_kbytes = (total_size+1023)//1024
+    return hashed.sha1.hexdigest(), bom_entries, install_kbytes
+
+
+def _write_cpio_entries(out, manifest, bom_entries, cancel_event, links=None):
+    """Write the cpio archive of a manifest to out and fill the bom_entries list.
+
+    If the digests of the manifest have already been computed, their Bom
+    checksums are used instead of computing them again. links is the
+    result of find_links() (or None). The files in links are written as
+    hard links: all of them get the inode number of the first file of
+    their group and the number of links in the group, but only the first
+    file carries the data (the others have a size of 0).
+    Returns the total size of the archived files (every file with
+    several links counts once).
+    """
+    if links is None:
+        links = {}
+    nlinks = {}
+    for first in links.values():
+        nlinks[first] = nlinks.get(first, 0)+1
+    # The inode numbers and checksums of the first files of the link groups
+    link_inos = {}
+    link_checksums = {}
+    total_size = 0
+    for ino,(path,st) in enumerate(manifest.iter_tree()):
+        if cancel_event is not None and cancel_event.is_set():
+            raise DistutilsExecError("Package build cancelled")
+        full_name = os.path.normpath(os.path.join(manifest.root, path))
+        mode = st.st_mode
+        cksum = Cksum()
+        checksum = None
+        link_target = None
+        if stat.S_ISDIR(mode):
+            _write_cpio_header(out, path, ino+1, mode, 2, st.st_mtime, 0)
+        elif stat.S_ISLNK(mode):
+            link_target = os.fsencode(os.readlink(full_name))
+            cksum.update(link_target)
+            _write_cpio_header(out, path, ino+1, mode, 1, st.st_mtime, len(link_target))
+            out.write(link_target)
+        elif stat.S_ISREG(mode):
+            if st.st_size>CPIO_MAX_FILE_SIZE:
+                raise DistutilsFileError("file too large for the package payload: %s"%full_name)
+            first = links.get(path)
+            if first is not None and first!=path:
+                _write_cpio_header(out, path, link_inos[first], mode, nlinks[first], st.st_mtime, 0)
+                bom_entries.append(BomEntry(path, st, link_checksums[first]))
+                continue
+            if first is not None:
+                link_inos[path] = ino+1
+                _write_cpio_header(out, path, ino+1, mode, nlinks[path], st.st_mtime, st.st_size)
+            else:
+                _write_cpio_header(out, path, ino+1, mode, 1, st.st_mtime, st.st_size)
+            if manifest.digests is not None and path in manifest.digests:
+                checksum = manifest.digests[path][1]
+                _copy_file_data(full_name, st.st_size, out, None)
+            else:
+                _copy_file_data(full_name, st.st_size, out, cksum)
+            total_size += st.st_size
+        else:
+            # Sockets, fifos, devices, ...
+            continue
+        if checksum is None:
+            checksum = cksum.value()
+        if path in link_inos:
+            link_checksums[path] = checksum
+        bom_entries.append(BomEntry(path, st, checksum, link_target))
+    _write_cpio_header(out, "TRAILER!!!", 0, 0, 1, 0, 0)
+    return total_size
+
+
+def find_links(manifest):
+    """Find the files of a manifest that can be stored as hard links.
+
+    Regular files (that aren't empty) with the same size, permissions and
+    content form a group. Returns a dict that maps the paths of the files
+    in the groups with more than one file to the path of the first file of
+    their group (which maps to itself). The digests of the manifest are
+    used if they have been computed, otherwise only the files whose size
+    and permissions match those of another file are read.
+    """
+    candidates = {}
+    for path,st in manifest.iter_tree():
+        if stat.S_ISREG(st.st_mode) and st.st_size>0:
+            candidates.setdefault((st.st_size, st.st_mode), []).append((path, st))
+    links = {}
+    for paths in candidates.values():
+        if len(paths)<2:
+            continue
+        groups = {}
+        for path,st in paths:
+            if manifest.digests is not None and path in manifest.digests:
+                digest = manifest.digests[path][0]
+            else:
+                digest = file_digests(os.path.join(manifest.root, path), cksum=False)[0]
+            groups.setdefault(digest, []).append(path)
+        for group in groups.values():
+            if len(group)>1:
+                for path in group:
+                    links[path] = group[0]
+    return links
+
+
+def package_info(identifier, version, install_location, num_files, install_kbytes):
+    """Return the content of the PackageInfo file as a bytes object.
+    """
+    xml = ['<?xml version="1.0" encoding="utf-8"?>']
+    xml += ['<pkg-info format-version="2" identifier=%s version=%s install-location=%s auth="root" overwrite-permissions="true" relocatable="false" postinstall-action="none" generator-version=%s>'%(quoteattr(identifier), quoteattr(version), quoteattr(install_location), quoteattr(GENERATOR_VERSION))]
+    xml += ['    <payload numberOfFiles="%d" installKBytes="%d"/>'%(num_files, install_kbytes)]
+    xml += ['    <bundle-version/>']
+    xml += ['    <upgrade-bundle/>']
+    xml += ['    <update-bundle/>']
+    xml += ['    <atomic-update-bundle/>']
+    xml += ['    <strict-identifier/>']
+    xml += ['    <relocate/>']
+    xml += ['</pkg-info>']
+    return ("\n".join(xml)+"\n").encode("utf-8")
+
+
+def build_component_package(pkg_name, root, identifier, version, install_location, include=None, exclude=None, manifest=None, cancel_event=None,
+                            compression="gzip", compression_level=DEFAULT_COMPRESSION_LEVEL, link_duplicates=False):
+    """Create a flat component package.
+
+    This is the native equivalent of calling
+    pkgbuild --root <root> --identifier <identifier> --version <version>
+             --install-location <install_location> <pkg_name>
+    If include or exclude are given, only some of the entries directly
+    inside root are packaged (see Manifest.filter()), so there is no need
+    to copy them into a separate root directory first. manifest may be
+    the (already filtered) Manifest of root which saves scanning the
+    directory again. compression and compression_level select the codec
+    used for the payload (see compress.py). If link_duplicates is True,
+    files with the same content are stored only once in the payload (the
+    other copies are stored and installed as hard links).
+    """
+    if manifest is None:
+        manifest = Manifest.scan(root).filter(include, exclude)
+    links = None
+    if link_duplicates:
+        links = find_links(manifest)
+        if links:
+            firsts = set(links.values())
+            saved = sum(manifest.get_stat(path).st_size for path in links if path not in firsts)
+            log.info("%s: %d duplicate files (%d bytes) stored as hard links"%(os.path.basename(pkg_name), len(links)-len(firsts), saved))
+    payload_name = pkg_name+".payload"
+    try:
+        payload_sha1,bom_entries,install_kbytes = write_payload(payload_name, manifest, cancel_event, compression, compression_level, links)
+        archive = xar.XarWriter()
+        archive.add_file("Bom", data=build_bom(bom_entries, links), compress=True)
+        archive.add_file("Payload", path=payload_name, checksum=payload_sha1)
+        archive.add_file("PackageInfo", data=package_info(identifier, version, install_location, len(bom_entries), install_kbytes), compress=True)
+        archive.write(pkg_name)
+    finally:
+        if os.path.exists(payload_name):
+            os.remove(payload_name)
+
+
+def recompress_payload(pkg_name, compression, compression_level=DEFAULT_COMPRESSION_LEVEL):
+    """Compress the payload of an existing component package again.
+
+    This is used to apply the selected compression to the packages
+    written by pkgbuild. The payload is decompressed and compressed in a
+    streaming fashion, the other members are copied as they are.
+    Returns False if the payload isn't gzip compressed (newer versions
+    of pkgbuild may use other formats) and the package was left alone.
+    """
+    reader = xar.XarReader(pkg_name)
+    for path,entry in reader.files:
+        if path=="Payload":
+            break
+    else:
+        raise DistutilsFileError("no payload in component package %s"%pkg_name)
+    source,offset = entry.source
+    if entry.encoding!=xar.ENCODING_NONE or not is_gzip(source, offset):
+        return False
+
+    payload_name = pkg_name+".payload"
+    tmp_name = pkg_name+".tmp"
+    try:
+        recompress_gzip(source, entry.length, offset, payload_name, compression, compression_level)
+        archive = xar.XarWriter()
+        for path,other in reader.files:
+            if path=="Payload":
+                archive.add_file("Payload", path=payload_name, mode=other.mode)
+            else:
+                archive.add_archived(path, other)
+        archive.write(tmp_name)
+        os.rename(tmp_name, pkg_name)
+    finally:
+        for name in [payload_name, tmp_name]:
+            if os.path.exists(name):
+                os.remove(name)
+    return True
+
+
+def get_install_kbytes(pkg_name):
+    """Return the installKBytes value from the PackageInfo of a component package.
+    """
+    pkg_info = ET.fromstring(xar.XarReader(pkg_name).read("PackageInfo"))
+    return int(pkg_info.find("payload").get("installKBytes"))
+
+
+def build_product_archive(pkg_name, distribution, component_pkgs, resources_dir):
+    """Create a product archive.
+
+    This is the native equivalent of calling productbuild. distribution is
+    the content of the Distribution file (bytes). The pkg-ref elements must
+    refer to the component packages as "#<name>.pkg". component_pkgs is a
+    list of component package file names (as written by
+    build_component_package() or pkgbuild). The members of the component
+    packages are copied into the product archive without decoding them.
+    resources_dir is the directory whose contents is stored as Resources.
+    Members that are identical in several component packages (such as the
+    payloads of pure Python packages built for several Python versions)
+    are only stored once.
+    """
+    archive = xar.XarWriter(dedup=True)
+    archive.add_file("Distribution", data=distribution, compress=True)
+
+    for dir_path,dir_names,file_names in os.walk(resources_dir):
+        dir_names.sort()
+        rel_dir = os.path.relpath(dir_path, resources_dir)
+        archive_dir = "Resources" if rel_dir=="." else "Resources/%s"%rel_dir.replace(os.sep, "/")
+        archive.add_directory(archive_dir)
+        for name in sorted(file_names):
+            full_name = os.path.join(dir_path, name)
+            archive.add_file("%s/%s"%(archive_dir, name), path=full_name, compress=True,
+                             mode=stat.S_IMODE(os.stat(full_name).st_mode))
+
+    for component_pkg in component_pkgs:
+        base_name = os.path.basename(component_pkg)
+        reader = xar.XarReader(component_pkg)
+        for path,entry in reader.files:
+            archive.add_archived("%s/%s"%(base_name, path), entry)
+
+    archive.write(pkg_name)
+    if archive.dedup_bytes>0:
+        log.info("%d bytes of identical package members stored only once"%archive.dedup_bytes)
+
+
+def _write_cpio_header(out, path, ino, mode, nlink, mtime, file_size):
+    name = _encode_path(path) + b"\0"
+    header = "070707%06o%06o%06o%06o%06o%06o%06o%011o%06o%011o"%(0, ino & 0o777777, mode & 0o777777, 0, 0, nlink, 0,
+                                                                int(mtime) & 0o77777777777, len(name), file_size)
+    out.write(header.encode("ascii"))
+    out.write(name)
+
+
+def _copy_file_data(file_name, size, out, cksum):
+    f = open(file_name, "rb")
+    try:
+        remaining = size
+        while remaining>0:
+            data = f.read(min(CHUNK_SIZE, remaining))
+            if not data:
+                raise DistutilsFileError("file changed while it was packaged: %s"%file_name)
+            out.write(data)
+            if cksum is not None:
+                cksum.update(data)
+            remaining -= len(data)
+    finally:
+        f.close()
+
+
+def _encode_path(path):
+    if isinstance(path, bytes):
+        return path
+    return os.fsencode(path)
@@ -0,0 +1,131 @@
+# Timing and size report of a bdist_osxinst run
+
+import sys, time, json, threading, contextlib
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+
+class BuildReport:
+    """Collects timings and sizes while an installer package is built.
+
+    The phases of the build are timed with the phase() context manager,
+    component packages are recorded with add_package() and the command line
+    tools that have been run with add_command(). The report can be written
+    as a JSON file with write().
+
+    Where the resource module is available, every phase also records the
+    peak memory usage (maximum resident set size in KB at the end of the
+    phase) and the number of file system blocks read and written during the
+    phase. Both cover the build process itself as well as the tools it has
+    run (the values of child processes are only known after they have
+    terminated).
+    """
+    def __init__(self):
+        self.start_time = time.time()
+        self.end_time = None
+        # List of (name, seconds, usage) tuples in the order the phases were finished.
+        # usage is a dict with the resource usage values (may be empty).
+        # Phases may be nested (e.g. the staging inside the package creation).
+        self.phases = []
+        # Information about the component packages (key: package file name)
+        self.packages = {}
+        # List of (command line, seconds, exit status, peak memory in KB) tuples of the tools that have been run
+        self.commands = []
+        # Additional top-level values (such as the product package name)
+        self.info = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Context manager that records the time spent in the with block.
+        """
+        t0 = time.time()
+        usage0 = get_resource_usage()
+        try:
+            yield
+        finally:
+            usage = get_resource_usage()
+            if usage:
+                usage["blocks_in"] -= usage0["blocks_in"]
+                usage["blocks_out"] -= usage0["blocks_out"]
+            self.add_phase(name, time.time()-t0, usage)
+
+    def add_phase(self, name, seconds, usage=None):
+        with self._lock:
+            self.phases.append((name, seconds, usage or {}))
+
+    def add_package(self, name, **values):
+        """Record information about a component package.
+
+        Can be called several times for the same package, the values
+        are merged. Safe to be called from several threads.
+        """
+        with self._lock:
+            self.packages.setdefault(name, {"name": name}).update(values)
+
+    def add_command(self, cmd, seconds, status, max_rss_kb=None):
+        """Record a command line tool that has been run.
+
+        max_rss_kb is the peak memory usage of the tool (None if unknown).
+        """
+        with self._lock:
+            self.commands.append((cmd, seconds, status, max_rss_kb))
+
+    def finish(self):
+        self.end_time = time.time()
+
+    def as_dict(self):
+        end_time = self.end_time if self.end_time is not None else time.time()
+        data = dict(self.info)
+        data["start_time"] = self.start_time
+        data["total_seconds"] = end_time-self.start_time
+        data["phases"] = []
+        for name,seconds,usage in self.phases:
+            phase = dict(usage)
+            phase.update({"name": name, "seconds": seconds})
+            data["phases"].append(phase)
+        data["packages"] = sorted(self.packages.values(), key=lambda p: p["name"])
+        data["commands"] = []
+        for cmd,seconds,status,max_rss_kb in self.commands:
+            command = {"command": cmd, "seconds": seconds, "status": status}
+            if max_rss_kb is not None:
+                command["max_rss_kb"] = max_rss_kb
+            data["commands"].append(command)
+        return data
+
+    def write(self, filename):
+        """Write the report as a JSON file.
+        """
+        f = open(filename, "wt")
+        json.dump(self.as_dict(), f, indent=2, sort_keys=True)
+        f.write("\n")
+        f.close()
+
+
+def get_resource_usage():
+    """Return the resource usage of this process and its terminated children.
+
+    Returns a dict with the keys max_rss_kb, blocks_in and blocks_out or an
+    empty dict if the resource module isn't available.
+    """
+    if resource is None:
+        return {}
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return {"max_rss_kb": max(max_rss_kb(own), max_rss_kb(children)),
+            "blocks_in": own.ru_inblock+children.ru_inblock,
+            "blocks_out": own.ru_oublock+children.ru_oublock}
+
+
+def max_rss_kb(usage):
+    """Return the peak memory usage (in KB) of a resource usage struct.
+
+    usage is the result of resource.getrusage() or os.wait4().
+    """
+    # ru_maxrss is in bytes on OSX and in KB elsewhere
+    if sys.platform=="darwin":
+        return usage.ru_maxrss//1024
+    return usage.ru_maxrss
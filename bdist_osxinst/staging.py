@@ -0,0 +1,122 @@
+# Putting files into a stage area without copying them
+
+import sys, os, os.path, shutil
+from distutils import log
+
+# Methods for putting files into a stage area (see Stager)
+STAGE_MODES = ["copy", "hardlink", "reflink", "move"]
+
+# ioctl request code of FICLONE on Linux (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+
+def clone_file(src, dst):
+    """Create dst as a copy-on-write clone (reflink) of src.
+
+    Raises OSError if the platform or the file system doesn't support
+    cloning files (or if src and dst are on different file systems).
+    """
+    if sys.platform=="darwin":
+        import ctypes, ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "clonefile"):
+            raise OSError("clonefile() is not available")
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0)!=0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+    elif sys.platform.startswith("linux"):
+        import fcntl
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            try:
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            except:
+                os.close(dst_fd)
+                os.remove(dst)
+                raise
+            os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    else:
+        raise OSError("cloning files is not supported on this platform")
+    shutil.copystat(src, dst)
+
+
+class Stager:
+    """Puts files and directories into a stage area.
+
+    mode is one of STAGE_MODES:
+
+    - copy:     copy the files (shutil.copy2)
+    - hardlink: create hard links to the source files
+    - reflink:  create copy-on-write clones of the source files
+    - move:     move the files (the source is gone afterwards)
+
+    Whenever the selected method doesn't work (e.g. because the source and
+    the stage area are on different file systems), the files are copied.
+    Symbolic links are always resolved and their targets copied (just
+    like shutil.copy2() and shutil.copytree() do by default).
+    The counts attribute records how many files were staged by each method.
+    """
+    def __init__(self, mode="copy"):
+        if mode not in STAGE_MODES:
+            raise ValueError("invalid stage mode: %s"%mode)
+        self.mode = mode
+        self.counts = dict((m, 0) for m in STAGE_MODES)
+        # Set to False after the first failure so that a method that isn't
+        # supported isn't tried again for every single file.
+        self._mode_works = True
+
+    def stage_file(self, src, dst):
+        """Put the file src into the stage area as dst.
+
+        An existing dst is replaced.
+        """
+        if os.path.lexists(dst):
+            os.remove(dst)
+        if self._mode_works and self.mode!="copy" and not os.path.islink(src):
+            try:
+                if self.mode=="hardlink":
+                    os.link(src, dst)
+                elif self.mode=="reflink":
+                    clone_file(src, dst)
+                else:
+                    os.rename(src, dst)
+                self.counts[self.mode] += 1
+                return
+            except OSError as exc:
+                log.info("%s not possible (%s), falling back to copying files"%(self.mode, exc))
+                self._mode_works = False
+        shutil.copy2(src, dst)
+        self.counts["copy"] += 1
+
+    def stage_tree(self, src, dst):
+        """Put the directory tree src into the stage area as dst.
+
+        An existing dst is replaced.
+        """
+        if os.path.exists(dst):
+            shutil.rmtree(dst)
+        if self.mode=="move" and self._mode_works and not os.path.islink(src):
+            try:
+                os.rename(src, dst)
+                self.counts["move"] += sum(len(files) for d,ds,files in os.walk(dst))
+                return
+            except OSError as exc:
+                log.info("move not possible (%s), falling back to copying files"%exc)
+                self._mode_works = False
+        if self.mode=="copy" or not self._mode_works or os.path.islink(src):
+            shutil.copytree(src, dst)
+            self.counts["copy"] += sum(len(files) for d,ds,files in os.walk(dst))
+            return
+
+        os.mkdir(dst)
+        for name in os.listdir(src):
+            src_name = os.path.join(src, name)
+            dst_name = os.path.join(dst, name)
+            if os.path.isdir(src_name):
+                self.stage_tree(src_name, dst_name)
+            else:
+                self.stage_file(src_name, dst_name)
+        shutil.copystat(src, dst)
@@ -0,0 +1,186 @@
+# Running the command line tools (pkgbuild, productbuild, mdls, ...)
+#
+# The tools are started directly from an argument vector (there is no shell
+# in between, so file names may contain quotes, spaces or any other
+# characters). Their output is passed to the log line by line while
+# they are running instead of being collected in memory. Only the last lines
+# are kept to be shown when a tool fails, so the memory usage doesn't depend
+# on how verbose a tool is. format_command() renders an argument vector as an
+# equivalent shell command line (for the log and the mkpkg.sh script).
+
+import os, subprocess, threading, time, collections
+from distutils.errors import DistutilsExecError
+from distutils import log
+from . import report
+try:
+    from shlex import quote
+except ImportError:
+    from pipes import quote
+
+# Number of output lines that are kept for the error message of a failed tool
+OUTPUT_TAIL_LINES = 50
+# Maximum length of a single output line (longer lines are split)
+MAX_LINE_LENGTH = 64*1024
+
+
+def format_command(args):
+    """Return the shell command line that runs the given argument vector.
+    """
+    return " ".join(quote(arg) for arg in args)
+
+
+class ToolRunner:
+    """Runs command line tools and records how long they took.
+
+    The tools may be run from several threads at once. All running tools
+    can be terminated with cancel(), after that no further tools are started
+    until the cancel event is cleared again. If timeout is set, tools that
+    run longer than timeout seconds are killed. The last tail_lines lines of
+    the output are logged as errors when a tool fails.
+    """
+    def __init__(self, cancel_event=None, timeout=None, tail_lines=OUTPUT_TAIL_LINES):
+        # Event that is set while the tools are cancelled
+        self.cancel_event = cancel_event if cancel_event is not None else threading.Event()
+        # Maximum run time of a tool in seconds (None = no limit)
+        self.timeout = timeout
+        self.tail_lines = tail_lines
+        # List of (command line, seconds, exit status, max_rss_kb) tuples of the
+        # tools that have finished. max_rss_kb is the peak memory usage of the
+        # tool (None if unknown).
+        self.timings = []
+        self._procs = set()
+        self._lock = threading.Lock()
+
+    def run(self, args, capture=False, echo=True):
+        """Run a tool and wait until it has finished.
+
+        args is the argument vector (args[0] is looked up in PATH). The
+        output of the tool is logged line by line (as info messages). If
+        capture is True, the standard output is returned as a string
+        instead (only the standard error output is logged). If echo is
+        False, the command line is not logged (the caller has already done
+        so).
+        Raises DistutilsExecError if the tool fails, times out or has
+        been cancelled.
+        """
+        cmd = format_command(args)
+        name = os.path.basename(args[0])
+        if echo:
+            log.info(cmd)
+        with self._lock:
+            if self.cancel_event.is_set():
+                raise DistutilsExecError("Command cancelled: %s"%cmd)
+            try:
+                proc = subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE if capture else subprocess.STDOUT)
+            except OSError as exc:
+                raise DistutilsExecError("can't run %s: %s"%(name, exc.strerror or exc))
+            self._procs.add(proc)
+
+        t0 = time.time()
+        timed_out = []
+        timer = None
+        if self.timeout:
+            timer = threading.Timer(self.timeout, self._kill, (proc, timed_out))
+            timer.daemon = True
+            timer.start()
+        out = None
+        tail = collections.deque(maxlen=self.tail_lines)
+        max_rss_kb = None
+        try:
+            if capture:
+                stderr_thread = threading.Thread(target=_log_lines, args=(proc.stderr, name, tail))
+                stderr_thread.daemon = True
+                stderr_thread.start()
+                out = proc.stdout.read()
+                stderr_thread.join()
+            else:
+                _log_lines(proc.stdout, name, tail)
+            max_rss_kb = _wait(proc)
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if proc.returncode is None:
+                # Interrupted while reading the output
+                self._kill(proc)
+                proc.wait()
+            for stream in [proc.stdout, proc.stderr]:
+                if stream is not None:
+                    stream.close()
+            with self._lock:
+                self._procs.discard(proc)
+        seconds = time.time()-t0
+        with self._lock:
+            self.timings.append((cmd, seconds, proc.returncode, max_rss_kb))
+        log.debug("%s finished in %.2fs (exit status %d, peak memory %s KB)"%(name, seconds, proc.returncode, max_rss_kb if max_rss_kb is not None else "?"))
+
+        if proc.returncode!=0 and not self.cancel_event.is_set():
+            log.error("ERROR running command: %s"%cmd)
+            if len(tail)==tail.maxlen:
+                log.error("(only the last %d lines of the output are shown)"%tail.maxlen)
+            for line in tail:
+                log.error(line)
+        if timed_out:
+            raise DistutilsExecError("%s didn't finish within %ss: %s"%(name, self.timeout, cmd))
+        if proc.returncode!=0:
+            if self.cancel_event.is_set():
+                raise DistutilsExecError("Command cancelled: %s"%cmd)
+            raise DistutilsExecError("%s failed with exit status %d: %s"%(name, proc.returncode, cmd))
+        if out is not None:
+            return out.decode("utf-8", "replace")
+
+    def cancel(self):
+        """Terminate all running tools and don't start new ones.
+        """
+        with self._lock:
+            self.cancel_event.set()
+            for proc in self._procs:
+                try:
+                    proc.terminate()
+                except OSError:
+                    pass
+
+    def _kill(self, proc, timed_out=None):
+        if timed_out is not None:
+            timed_out.append(True)
+        try:
+            proc.kill()
+        except OSError:
+            pass
+
+
+def _log_lines(stream, name, tail):
+    """Log the lines read from stream (until the end of the stream).
+
+    The lines are also appended to tail (a bounded deque).
+    """
+    for line in iter(lambda: stream.readline(MAX_LINE_LENGTH), b""):
+        line = line.decode("utf-8", "replace").rstrip()
+        if line:
+            log.info("%s: %s"%(name, line))
+            tail.append(line)
+
+
+def _wait(proc):
+    """Wait for a process to terminate and return its peak memory usage in KB.
+
+    Returns None if the memory usage isn't available (no os.wait4()).
+    """
+    if not hasattr(os, "wait4"):
+        proc.wait()
+        return None
+    while True:
+        try:
+            pid,status,usage = os.wait4(proc.pid, 0)
+            break
+        except InterruptedError:
+            continue
+        except ChildProcessError:
+            # Already reaped (e.g. by Popen itself)
+            proc.wait()
+            return None
+    if os.WIFSIGNALED(status):
+        proc.returncode = -os.WTERMSIG(status)
+    else:
+        proc.returncode = os.WEXITSTATUS(status)
+    return report.max_rss_kb(usage)
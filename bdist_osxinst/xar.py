@@ -0,0 +1,308 @@
+# Reading and writing xar archives (the container format of flat OSX installer packages)
+#
+# Notes: See the xar file format description at
+#        https://github.com/mackyle/xar/wiki/xarformat
+
+import os, os.path, struct, hashlib, zlib, time
+import xml.etree.ElementTree as ET
+from .manifest import CHUNK_SIZE, file_digests
+
+# The magic number at the beginning of every xar archive ("xar!")
+XAR_MAGIC = 0x78617221
+# Header: magic, header size, version, compressed/uncompressed TOC size, checksum algorithm
+XAR_HEADER = struct.Struct(">IHHQQI")
+# Checksum algorithm id for sha1 in the xar header
+XAR_CKSUM_SHA1 = 1
+
+# Encoding styles of the data stored in the heap
+ENCODING_NONE = "application/octet-stream"
+ENCODING_ZLIB = "application/x-gzip"
+
+
+class XarEntry:
+    """A single file or directory inside a xar archive.
+    """
+    def __init__(self, name, type, mode, mtime):
+        # The name of the entry (without path)
+        self.name = name
+        # "file" or "directory"
+        self.type = type
+        # The permission bits
+        self.mode = mode
+        # The modification time (seconds since the epoch)
+        self.mtime = mtime
+        # Child entries (only used by directories)
+        self.children = []
+        # The stored data. This is a tuple (source, offset) where source is
+        # either a bytes object or the name of a file that contains the data
+        # at the given offset.
+        self.source = None
+        # Number of bytes stored in the heap
+        self.length = 0
+        # Number of bytes after decoding the data
+        self.size = 0
+        # The encoding style of the stored data
+        self.encoding = ENCODING_NONE
+        # Hex digests of the stored and of the decoded data
+        self.archived_checksum = None
+        self.extracted_checksum = None
+
+
+class XarWriter:
+    """Create a xar archive.
+
+    Files are added with add_file(). The names may contain "/" to put
+    files into sub-directories, the directories are created automatically.
+    Nothing is written until write() is called. Data that is given as a
+    file name is only read when the archive gets written, so large files
+    (such as package payloads) are streamed directly into the archive.
+    If dedup is True, files with identical stored data (same sha1 digest,
+    length and encoding) share a single copy of the data in the heap.
+    """
+    def __init__(self, dedup=False):
+        self.root = XarEntry("", "directory", 0o755, None)
+        self.dedup = dedup
+        # Number of heap bytes saved by dedup (set by write())
+        self.dedup_bytes = 0
+
+    def add_directory(self, name, mode=0o755, mtime=None):
+        """Add a directory (and all its parents) and return the XarEntry object.
+        """
+        entry = self.root
+        for part in name.strip("/").split("/"):
+            for child in entry.children:
+                if child.name==part:
+                    if child.type!="directory":
+                        raise ValueError("'%s' is not a directory"%name)
+                    entry = child
+                    break
+            else:
+                child = XarEntry(part, "directory", mode, mtime)
+                entry.children.append(child)
+                entry = child
+        return entry
+
+    def add_file(self, name, data=None, path=None, compress=False, checksum=None, mode=0o644, mtime=None):
+        """Add a file to the archive.
+
+        The file content is either given as a bytes object (data) or as the
+        name of a file (path). If compress is True, the data is stored zlib
+        compressed. checksum may be the sha1 hex digest of the file content
+        which saves reading an uncompressed file twice.
+        """
+        if (data is None)==(path is None):
+            raise ValueError("either data or path must be given")
+        if compress:
+            if data is None:
+                f = open(path, "rb")
+                data = f.read()
+                f.close()
+            encoded = zlib.compress(data, 9)
+            entry = self._new_file(name, mode, mtime)
+            entry.source = (encoded, 0)
+            entry.length = len(encoded)
+            entry.size = len(data)
+            entry.encoding = ENCODING_ZLIB
+            entry.archived_checksum = hashlib.sha1(encoded).hexdigest()
+            entry.extracted_checksum = hashlib.sha1(data).hexdigest()
+        elif data is not None:
+            entry = self._new_file(name, mode, mtime)
+            entry.source = (data, 0)
+            entry.length = entry.size = len(data)
+            entry.archived_checksum = entry.extracted_checksum = hashlib.sha1(data).hexdigest()
+        else:
+            if checksum is None:
+                checksum = file_digests(path, cksum=False)[0]
+            entry = self._new_file(name, mode, mtime)
+            entry.source = (path, 0)
+            entry.length = entry.size = os.path.getsize(path)
+            entry.archived_checksum = entry.extracted_checksum = checksum
+        return entry
+
+    def add_archived(self, name, entry):
+        """Add a file that is stored in another archive.
+        
+        entry is a XarEntry object as returned by XarReader. Its data is
+        copied into the new archive as is, so compressed data doesn't get
+        decompressed and compressed again.
+        """
+        new_entry = self._new_file(name, entry.mode, entry.mtime)
+        for attr in ["source", "length", "size", "encoding", "archived_checksum", "extracted_checksum"]:
+            setattr(new_entry, attr, getattr(entry, attr))
+        return new_entry
+
+    def write(self, filename):
+        """Write the archive to the given file.
+        """
+        # Assign heap offsets (offset 0 holds the TOC checksum)
+        offset = hashlib.sha1().digest_size
+        entries = []
+        # Heap offsets of the stored data (key: (checksum, length, encoding))
+        stored = {}
+        self.dedup_bytes = 0
+        for entry in self._iter_entries(self.root):
+            if entry.type=="file":
+                key = (entry.archived_checksum, entry.length, entry.encoding)
+                if self.dedup and key in stored:
+                    entry.offset = stored[key]
+                    self.dedup_bytes += entry.length
+                    continue
+                entry.offset = offset
+                stored[key] = offset
+                offset += entry.length
+                entries.append(entry)
+
+        toc = self._toc_xml()
+        toc_compressed = zlib.compress(toc, 9)
+        header = XAR_HEADER.pack(XAR_MAGIC, XAR_HEADER.size, 1, len(toc_compressed), len(toc), XAR_CKSUM_SHA1)
+
+        f = open(filename, "wb")
+        try:
+            f.write(header)
+            f.write(toc_compressed)
+            f.write(hashlib.sha1(toc_compressed).digest())
+            for entry in entries:
+                source,start = entry.source
+                if isinstance(source, bytes):
+                    f.write(source[start:start+entry.length])
+                else:
+                    copy_file_range(source, start, entry.length, f)
+        finally:
+            f.close()
+
+    def _new_file(self, name, mode, mtime):
+        dir_name,_,base_name = name.strip("/").rpartition("/")
+        parent = self.add_directory(dir_name) if dir_name else self.root
+        for child in parent.children:
+            if child.name==base_name:
+                raise ValueError("duplicate archive member: %s"%name)
+        entry = XarEntry(base_name, "file", mode, mtime)
+        parent.children.append(entry)
+        return entry
+
+    def _iter_entries(self, entry):
+        for child in entry.children:
+            yield child
+            for sub in self._iter_entries(child):
+                yield sub
+
+    def _toc_xml(self):
+        """Return the (uncompressed) table of contents as a bytes object.
+        """
+        xar = ET.Element("xar")
+        toc = ET.SubElement(xar, "toc")
+        checksum = ET.SubElement(toc, "checksum", style="sha1")
+        ET.SubElement(checksum, "offset").text = "0"
+        ET.SubElement(checksum, "size").text = str(hashlib.sha1().digest_size)
+        ET.SubElement(toc, "creation-time").text = _timestamp(None)
+        ids = [0]
+        def add(parent_elem, entry):
+            ids[0] += 1
+            elem = ET.SubElement(parent_elem, "file", id=str(ids[0]))
+            if entry.type=="file":
+                data = ET.SubElement(elem, "data")
+                ET.SubElement(data, "length").text = str(entry.length)
+                ET.SubElement(data, "offset").text = str(entry.offset)
+                ET.SubElement(data, "size").text = str(entry.size)
+                ET.SubElement(data, "encoding", style=entry.encoding)
+                ET.SubElement(data, "extracted-checksum", style="sha1").text = entry.extracted_checksum
+                ET.SubElement(data, "archived-checksum", style="sha1").text = entry.archived_checksum
+            ET.SubElement(elem, "mtime").text = _timestamp(entry.mtime)
+            ET.SubElement(elem, "group").text = "wheel"
+            ET.SubElement(elem, "gid").text = "0"
+            ET.SubElement(elem, "user").text = "root"
+            ET.SubElement(elem, "uid").text = "0"
+            ET.SubElement(elem, "mode").text = "%04o"%entry.mode
+            ET.SubElement(elem, "type").text = entry.type
+            ET.SubElement(elem, "name").text = entry.name
+            for child in entry.children:
+                add(elem, child)
+        for entry in self.root.children:
+            add(toc, entry)
+        return b'<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(xar)
+
+
+class XarReader:
+    """Read the table of contents of a xar archive.
+
+    The file entries are available via the files attribute which is a list
+    of (path, XarEntry) tuples. The data itself is only read on demand.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        f = open(filename, "rb")
+        try:
+            header = f.read(XAR_HEADER.size)
+            if len(header)<XAR_HEADER.size:
+                raise ValueError("not a xar archive: %s"%filename)
+            magic,header_size,version,toc_length,toc_size,cksum_alg = XAR_HEADER.unpack(header)
+            if magic!=XAR_MAGIC:
+                raise ValueError("not a xar archive: %s"%filename)
+            f.seek(header_size)
+            toc = zlib.decompress(f.read(toc_length))
+        finally:
+            f.close()
+        heap_offset = header_size+toc_length
+
+        self.files = []
+        def scan(elem, prefix):
+            for file_elem in elem.findall("file"):
+                name = prefix+file_elem.findtext("name")
+                type = file_elem.findtext("type")
+                mode = int(file_elem.findtext("mode") or "644", 8)
+                entry = XarEntry(name.rpartition("/")[2], type, mode, None)
+                data = file_elem.find("data")
+                if type=="file" and data is not None:
+                    entry.source = (filename, heap_offset+int(data.findtext("offset")))
+                    entry.length = int(data.findtext("length"))
+                    entry.size = int(data.findtext("size"))
+                    entry.encoding = data.find("encoding").get("style")
+                    entry.archived_checksum = data.findtext("archived-checksum")
+                    entry.extracted_checksum = data.findtext("extracted-checksum")
+                    self.files.append((name, entry))
+                elif type=="directory":
+                    scan(file_elem, name+"/")
+        scan(ET.fromstring(toc).find("toc"), "")
+
+    def read(self, name):
+        """Return the (decoded) content of the file with the given path.
+        """
+        for path,entry in self.files:
+            if path==name:
+                break
+        else:
+            raise KeyError(name)
+        source,offset = entry.source
+        f = open(source, "rb")
+        try:
+            f.seek(offset)
+            data = f.read(entry.length)
+        finally:
+            f.close()
+        if entry.encoding==ENCODING_ZLIB:
+            data = zlib.decompress(data)
+        elif entry.encoding!=ENCODING_NONE:
+            raise ValueError("unsupported encoding: %s"%entry.encoding)
+        return data
+
+
+def copy_file_range(src_name, offset, length, dst):
+    """Copy length bytes starting at offset from the file src_name to the file object dst.
+    """
+    f = open(src_name, "rb")
+    try:
+        f.seek(offset)
+        while length>0:
+            data = f.read(min(CHUNK_SIZE, length))
+            if not data:
+                raise IOError("unexpected end of file: %s"%src_name)
+            dst.write(data)
+            length -= len(data)
+    finally:
+        f.close()
+
+
+def _timestamp(t):
+    if t is None:
+        t = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))
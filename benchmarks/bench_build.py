@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# Benchmark of the bdist_osxinst packaging pipeline
+#
+# Generates a synthetic distribution of configurable shape and runs the
+# bdist_osxinst command on it end to end (in a separate process for every
+# run). The timings, the peak memory usage and the disk I/O of the
+# individual build phases are taken from the build report that
+# bdist_osxinst writes next to the product package.
+#
+# The pkgbuild backend uses the real pkgbuild/productbuild tools when they
+# are available (i.e. on OSX). Everywhere else (or with --stub-tools) it
+# uses stand-in tools that only create empty output files, so the numbers
+# cover the work done by bdist_osxinst itself (install, staging, inventory,
+# xml generation, ...) but not the work of the tools. The native backend
+# works on every platform.
+#
+# Examples:
+#
+#   python benchmarks/bench_build.py --packages 50 --files 200
+#   python benchmarks/bench_build.py --backend native --repeat 5 --json new.json
+#   python benchmarks/bench_build.py --baseline old.json
+
+import sys, os, os.path, argparse, json, shutil, subprocess, tempfile, time
+
+# The root of the bdist_osxinst source tree (the parent of this directory)
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SOURCE_ROOT)
+from bdist_osxinst.report import max_rss_kb
+
+SETUP_TEMPLATE = """\
+import sys, os
+sys.path.insert(0, %(source_root)r)
+from distutils.core import setup
+from distutils.sysconfig import get_python_lib
+import bdist_osxinst.bdist_osxinst
+
+setup(name = "benchdist",
+      version = "1.0",
+      url = "http://bench.example.org/benchdist",
+      packages = %(packages)r,
+      package_data = dict((name, ["*.bin"]) for name in %(packages)r),
+      py_modules = %(modules)r,
+      scripts = %(scripts)r,
+      data_files = [(os.path.join(get_python_lib(prefix=""), d), fs) for d,fs in %(data_files)r],
+      cmdclass = {"bdist_osxinst":bdist_osxinst.bdist_osxinst.bdist_osxinst})
+"""
+
+STUB_TOOLS = {
+    # pkgbuild/productbuild: create an empty output package (the last argument)
+    "pkgbuild": "open(sys.argv[-1], 'wb').close()\n",
+    "productbuild": "open(sys.argv[-1], 'wb').close()\n",
+    # mdls: return the UTI of an rtf file
+    "mdls": "sys.stdout.write('public.rtf')\n",
+}
+
+
+def create_distribution(dist_dir, options):
+    """Create the synthetic distribution in dist_dir.
+    """
+    if os.path.exists(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+    # Deterministic file content that doesn't compress too well
+    chunk = bytes(bytearray((i*i*7919+i)%251 for i in range(65536)))
+
+    def write_file(path, size, header=b""):
+        d = os.path.dirname(path)
+        if not os.path.exists(d):
+            os.makedirs(d)
+        f = open(path, "wb")
+        f.write(header)
+        remaining = size
+        while remaining>0:
+            f.write(chunk[:remaining])
+            remaining -= len(chunk)
+        f.close()
+
+    packages = []
+    for i in range(options.packages):
+        pkg_name = "bpkg%03d"%i
+        names = [pkg_name]+["%s.sub%d"%(pkg_name, j) for j in range(options.subpackages)]
+        packages.extend(names)
+        for j,name in enumerate(names):
+            pkg_dir = os.path.join(dist_dir, *name.split("."))
+            write_file(os.path.join(pkg_dir, "__init__.py"), 0)
+            # Python modules and binary package data
+            for k in range(options.files//len(names)):
+                write_file(os.path.join(pkg_dir, "mod%04d.py"%k), 0, b"VALUE = %d\n"%k)
+                write_file(os.path.join(pkg_dir, "data%04d.bin"%k), options.file_size)
+    modules = []
+    for i in range(options.modules):
+        name = "bmod%03d"%i
+        modules.append(name)
+        write_file(os.path.join(dist_dir, name+".py"), 0, b"VALUE = %d\n"%i)
+    scripts = []
+    for i in range(options.scripts):
+        name = os.path.join("scripts", "btool%03d"%i)
+        scripts.append(name)
+        write_file(os.path.join(dist_dir, name), 0, b"#!/usr/bin/env python\nprint(%d)\n"%i)
+    data_files = []
+    for i in range(options.data_dirs):
+        name = "bdata%03d"%i
+        files = []
+        for k in range(options.data_files):
+            path = os.path.join("data", name, "file%04d.dat"%k)
+            write_file(os.path.join(dist_dir, path), options.file_size)
+            files.append(path)
+        data_files.append((name, files))
+
+    f = open(os.path.join(dist_dir, "setup.py"), "wt")
+    f.write(SETUP_TEMPLATE%{"source_root": SOURCE_ROOT,
+                            "packages": packages,
+                            "modules": modules,
+                            "scripts": scripts,
+                            "data_files": data_files})
+    f.close()
+
+
+def create_stub_tools(bin_dir):
+    """Create the stand-in pkgbuild/productbuild/mdls executables in bin_dir.
+    """
+    if not os.path.exists(bin_dir):
+        os.makedirs(bin_dir)
+    for name,code in STUB_TOOLS.items():
+        path = os.path.join(bin_dir, name)
+        f = open(path, "wt")
+        f.write("#!%s\nimport sys\n%s"%(sys.executable, code))
+        f.close()
+        os.chmod(path, 0o755)
+
+
+def run_build(dist_dir, backend, options, env):
+    """Run bdist_osxinst once and return the result dict.
+    """
+    for name in ["build", "dist"]:
+        if os.path.exists(os.path.join(dist_dir, name)):
+            shutil.rmtree(os.path.join(dist_dir, name))
+    cmd = [sys.executable, "setup.py", "-q", "bdist_osxinst", "--backend=%s"%backend]
+    if options.jobs is not None:
+        cmd.append("--jobs=%d"%options.jobs)
+    cmd.extend(options.extra_args)
+
+    t0 = time.time()
+    proc = subprocess.Popen(cmd, cwd=dist_dir, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = proc.stdout.read()
+    proc.stdout.close()
+    if hasattr(os, "wait4"):
+        pid,status,usage = os.wait4(proc.pid, 0)
+        returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+    else:
+        usage = None
+        returncode = proc.wait()
+    wall_time = time.time()-t0
+    if returncode!=0:
+        sys.stderr.write(output.decode("utf-8", "replace"))
+        raise RuntimeError("bdist_osxinst failed (exit status %d)"%returncode)
+
+    report_names = [name for name in os.listdir(os.path.join(dist_dir, "dist")) if name.endswith("-report.json")]
+    if len(report_names)!=1:
+        raise RuntimeError("no build report found in %s"%os.path.join(dist_dir, "dist"))
+    f = open(os.path.join(dist_dir, "dist", report_names[0]), "rt")
+    report = json.load(f)
+    f.close()
+
+    result = {"wall_seconds": wall_time, "report": report}
+    if usage is not None:
+        result.update({"max_rss_kb": max_rss_kb(usage),
+                       "blocks_in": usage.ru_inblock,
+                       "blocks_out": usage.ru_oublock})
+    return result
+
+
+def summarize(runs):
+    """Combine the results of several runs of the same backend.
+
+    Returns a dict with the median wall time, the maximum peak memory usage
+    and the per-phase values (median time, maximum memory, median I/O).
+    """
+    def median(values):
+        values = sorted(values)
+        return values[len(values)//2] if values else 0
+
+    summary = {"runs": len(runs),
+               "wall_seconds": median([r["wall_seconds"] for r in runs]),
+               "max_rss_kb": max([r.get("max_rss_kb", 0) for r in runs]),
+               "blocks_in": median([r.get("blocks_in", 0) for r in runs]),
+               "blocks_out": median([r.get("blocks_out", 0) for r in runs]),
+               "product_bytes": runs[-1]["report"].get("product_bytes", 0),
+               "phases": {}}
+    phase_names = []
+    for phase in runs[0]["report"]["phases"]:
+        if phase["name"] not in phase_names:
+            phase_names.append(phase["name"])
+    for name in phase_names:
+        phases = [p for r in runs for p in r["report"]["phases"] if p["name"]==name]
+        summary["phases"][name] = {"seconds": median([p["seconds"] for p in phases]),
+                                   "max_rss_kb": max([p.get("max_rss_kb", 0) for p in phases]),
+                                   "blocks_in": median([p.get("blocks_in", 0) for p in phases]),
+                                   "blocks_out": median([p.get("blocks_out", 0) for p in phases])}
+    summary["phase_order"] = phase_names
+    return summary
+
+
+def print_summary(backend, summary):
+    print("")
+    print("backend: %s (%d runs, median wall time %.3fs, peak RSS %d KB, product %d bytes)"%
+          (backend, summary["runs"], summary["wall_seconds"], summary["max_rss_kb"], summary["product_bytes"]))
+    print("  %-22s %10s %12s %10s %10s"%("phase", "seconds", "peak RSS KB", "blocks in", "blocks out"))
+    for name in summary["phase_order"]:
+        phase = summary["phases"][name]
+        print("  %-22s %10.3f %12d %10d %10d"%(name, phase["seconds"], phase["max_rss_kb"], phase["blocks_in"], phase["blocks_out"]))
+
+
+def compare(results, baseline, tolerance, min_seconds):
+    """Compare the phase timings with a baseline.
+
+    Returns a list of messages about the phases that got slower by more
+    than tolerance (a fraction) and by more than min_seconds.
+    """
+    regressions = []
+    for backend,summary in results["backends"].items():
+        base = baseline.get("backends", {}).get(backend)
+        if base is None:
+            continue
+        items = [("total", summary["wall_seconds"], base["wall_seconds"])]
+        for name in summary["phase_order"]:
+            if name in base["phases"]:
+                items.append((name, summary["phases"][name]["seconds"], base["phases"][name]["seconds"]))
+        for name,seconds,base_seconds in items:
+            if seconds-base_seconds>min_seconds and seconds>base_seconds*(1.0+tolerance):
+                regressions.append("%s/%s: %.3fs -> %.3fs (+%.0f%%)"%(backend, name, base_seconds, seconds, 100.0*(seconds/base_seconds-1.0) if base_seconds>0 else 100.0))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bdist_osxinst on a synthetic distribution.")
+    group = parser.add_argument_group("shape of the synthetic distribution")
+    group.add_argument("--packages", type=int, default=10, help="number of top-level packages (default: 10)")
+    group.add_argument("--subpackages", type=int, default=2, help="number of sub-packages per package (default: 2)")
+    group.add_argument("--files", type=int, default=50, help="number of modules (plus the same number of binary files) per top-level package (default: 50)")
+    group.add_argument("--file-size", type=int, default=4096, help="size of the binary and data files in bytes (default: 4096)")
+    group.add_argument("--modules", type=int, default=5, help="number of loose top-level modules (default: 5)")
+    group.add_argument("--scripts", type=int, default=3, help="number of scripts (default: 3)")
+    group.add_argument("--data-dirs", type=int, default=2, help="number of data directories in site-packages (default: 2)")
+    group.add_argument("--data-files", type=int, default=20, help="number of files per data directory (default: 20)")
+    parser.add_argument("--backend", choices=["pkgbuild", "native", "all"], default="all", help="backend(s) to benchmark (default: all)")
+    parser.add_argument("--stub-tools", action="store_true", help="use the stand-in tools even if pkgbuild/productbuild are available")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs per backend (default: 3)")
+    parser.add_argument("--jobs", type=int, default=None, help="value of the --jobs option")
+    parser.add_argument("--work-dir", default=None, help="directory for the distribution (default: a temporary directory that is removed afterwards)")
+    parser.add_argument("--json", default=None, help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="JSON file from a previous run; exit with status 1 if a phase got slower")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slow down relative to the baseline (default: 0.2)")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="ignore slow downs below this many seconds (default: 0.05)")
+    parser.add_argument("extra_args", nargs="*", help="additional bdist_osxinst options (after --)")
+    options = parser.parse_args()
+
+    backends = ["pkgbuild", "native"] if options.backend=="all" else [options.backend]
+    use_stubs = options.stub_tools or shutil.which("pkgbuild") is None or shutil.which("productbuild") is None
+    # The packages of the stand-in pkgbuild have no payload that could be recompressed
+    if use_stubs and "pkgbuild" in backends and [arg for arg in options.extra_args if arg.startswith("--compression")]:
+        parser.error("the compression options can't be used with the stand-in pkgbuild tool "
+                     "(use --backend native)")
+
+    work_dir = options.work_dir
+    if work_dir is None:
+        work_dir = tempfile.mkdtemp(prefix="bench_osxinst")
+    try:
+        dist_dir = os.path.join(work_dir, "benchdist")
+        create_distribution(dist_dir, options)
+
+        env = dict(os.environ)
+        if use_stubs:
+            bin_dir = os.path.join(work_dir, "bin")
+            create_stub_tools(bin_dir)
+            env["PATH"] = bin_dir+os.pathsep+env.get("PATH", "")
+
+        results = {"shape": {"packages": options.packages,
+                             "subpackages": options.subpackages,
+                             "files": options.files,
+                             "file_size": options.file_size,
+                             "modules": options.modules,
+                             "scripts": options.scripts,
+                             "data_dirs": options.data_dirs,
+                             "data_files": options.data_files},
+                   "stub_tools": use_stubs,
+                   "python": "%d.%d"%sys.version_info[:2],
+                   "platform": sys.platform,
+                   "backends": {}}
+        for backend in backends:
+            runs = []
+            for i in range(options.repeat):
+                runs.append(run_build(dist_dir, backend, options, env))
+            results["backends"][backend] = summarize(runs)
+            print_summary(backend, results["backends"][backend])
+    finally:
+        if options.work_dir is None:
+            shutil.rmtree(work_dir)
+
+    if options.json is not None:
+        f = open(options.json, "wt")
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+        f.close()
+
+    if options.baseline is not None:
+        f = open(options.baseline, "rt")
+        baseline = json.load(f)
+        f.close()
+        regressions = compare(results, baseline, options.tolerance, options.min_seconds)
+        print("")
+        if regressions:
+            print("Slower than the baseline:")
+            for msg in regressions:
+                print("  %s"%msg)
+            sys.exit(1)
+        print("No regressions compared to %s"%options.baseline)
+
+
+if __name__=="__main__":
+    main()
@@ -20,6 +20,7 @@ setup(name = "bdist_osxinst",
       license = "Revised BSD License",
       url = "https://github.com/MacPython/osxinst",
       packages = ["bdist_osxinst"],
+      package_data = {"bdist_osxinst":["background-dimmed.png"]},
       cmdclass = {"bdist_osxinst":bdist_osxinst.bdist_osxinst.bdist_osxinst},
       command_options = {"bdist_osxinst" : {"license":("setup.py","license.rtf"),
                                             "config_str":("setup.py",config)}}